@@ -3,11 +3,15 @@ API routes for MongoDB Atlas Clusters.
 """
 
 from fastapi import APIRouter, HTTPException, Query, Body, Response, Request
-from typing import Dict, Any, List, Optional
+from fastapi.responses import StreamingResponse
+from typing import Dict, Any, AsyncIterator, List, Optional, Union
 from pydantic import BaseModel
 from pymongo import MongoClient
 from pymongo.errors import OperationFailure, ServerSelectionTimeoutError, ConnectionFailure, ConfigurationError
 import urllib.parse
+import asyncio
+import hashlib
+import json
 import time
 from slowapi import Limiter
 from slowapi.util import get_remote_address
@@ -23,6 +27,15 @@ limiter = Limiter(key_func=get_remote_address)
 _cluster_cache = {}
 _cache_ttl = 30  # seconds
 
+# How often each cluster event stream checks Atlas for state changes
+_events_poll_interval = 10  # seconds
+
+
+def _compute_etag(data: Dict[str, Any]) -> str:
+    """Compute a strong ETag for a JSON-serializable response body."""
+    body = json.dumps(data, sort_keys=True, default=str).encode("utf-8")
+    return f'"{hashlib.sha256(body).hexdigest()}"'
+
 
 class ClusterLoginRequest(BaseModel):
     """Request model for cluster login."""
@@ -318,21 +331,129 @@ async def list_flex_clusters(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/{project_id}/{cluster_name}")
-async def get_cluster(project_id: str, cluster_name: str) -> Dict[str, Any]:
+def _cluster_states(
+    regular: Dict[str, Any], flex: Dict[str, Any]
+) -> Dict[str, Dict[str, Any]]:
+    """Reduce regular and Flex cluster listings to a name -> state summary map."""
+    states = {}
+    for cluster in regular.get("results", []):
+        states[cluster["name"]] = {
+            "name": cluster["name"],
+            "stateName": cluster.get("stateName", "UNKNOWN"),
+            "paused": cluster.get("paused", False),
+            "type": "regular",
+        }
+    for cluster in flex.get("results", []):
+        states[cluster["name"]] = {
+            "name": cluster["name"],
+            "stateName": cluster.get("stateName", "IDLE"),
+            "paused": False,  # Flex clusters can't be paused
+            "type": "flex",
+        }
+    return states
+
+
+@router.get("/events/{project_id}")
+async def stream_cluster_events(
+    project_id: str,
+    request: Request,
+    until_idle: bool = Query(False, description="Close the stream once every cluster is IDLE"),
+) -> StreamingResponse:
+    """
+    Server-Sent Events endpoint for cluster state changes in a project.
+
+    Atlas has no push API for cluster state, so the server checks the
+    project's regular and Flex clusters every few seconds on the client's
+    behalf and only sends what changed:
+
+    - ``init``: current state of each cluster, sent once on connect
+    - ``state``: a cluster whose state or paused flag changed
+    - ``removed``: a cluster that no longer exists
+    - ``error``: Atlas could not be queried (the stream keeps going)
+    - ``idle``: every cluster is IDLE (only with ``until_idle``; the
+      stream then ends)
+
+    Quiet checks send a keepalive comment.
+
+    Args:
+        project_id: MongoDB Atlas project ID
+        until_idle: Close the stream once every cluster is IDLE and unpaused
+    """
+    async def event_generator() -> AsyncIterator[str]:
+        """Generate SSE events"""
+        previous = None
+        async with AtlasClient() as client:
+            while not await request.is_disconnected():
+                try:
+                    regular, flex = await asyncio.gather(
+                        client.list_clusters(project_id),
+                        client.list_flex_clusters(project_id),
+                    )
+                except Exception as e:
+                    yield f"event: error\ndata: {json.dumps({'detail': str(e)})}\n\n"
+                else:
+                    current = _cluster_states(regular, flex)
+                    if previous is None:
+                        for state in current.values():
+                            yield f"event: init\ndata: {json.dumps(state)}\n\n"
+                    else:
+                        changed = [
+                            state for name, state in current.items()
+                            if previous.get(name) != state
+                        ]
+                        removed = [name for name in previous if name not in current]
+                        for state in changed:
+                            yield f"event: state\ndata: {json.dumps(state)}\n\n"
+                        for name in removed:
+                            yield f"event: removed\ndata: {json.dumps({'name': name})}\n\n"
+                        if not changed and not removed:
+                            yield ": keepalive\n\n"
+                    previous = current
+
+                    if until_idle and all(
+                        state["stateName"] == "IDLE" and not state["paused"]
+                        for state in current.values()
+                    ):
+                        yield "event: idle\ndata: {}\n\n"
+                        return
+
+                await asyncio.sleep(_events_poll_interval)
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",  # Disable nginx buffering
+        }
+    )
+
+
+@router.get("/{project_id}/{cluster_name}", response_model=None)
+async def get_cluster(
+    project_id: str,
+    cluster_name: str,
+    request: Request,
+    response: Response,
+) -> Union[Dict[str, Any], Response]:
     """
     Get details of a specific cluster.
 
+    The response carries an ETag header. Pollers can send it back in
+    If-None-Match and receive an empty 304 response while the cluster
+    is unchanged.
+
     Args:
         project_id: MongoDB Atlas project ID
         cluster_name: Cluster name
 
     Returns:
-        Cluster details
+        Cluster details, or 304 Not Modified if the ETag matches
     """
     try:
         async with AtlasClient() as client:
-            return await client.get_cluster(project_id, cluster_name)
+            result = await client.get_cluster(project_id, cluster_name)
     except Exception as e:
         if "404" in str(e):
             raise HTTPException(
@@ -341,6 +462,14 @@ async def get_cluster(project_id: str, cluster_name: str) -> Dict[str, Any]:
             )
         raise HTTPException(status_code=500, detail=str(e))
 
+    etag = _compute_etag(result)
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=304, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
+    return result
+
 
 @router.post("/{project_id}")
 async def create_cluster(
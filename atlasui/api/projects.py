@@ -3,7 +3,7 @@ API routes for MongoDB Atlas Projects (Groups).
 """
 
 from fastapi import APIRouter, HTTPException, Query, Body
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 from atlasui.client import AtlasClient
 
@@ -14,6 +14,9 @@ router = APIRouter()
 async def list_projects(
     page_num: int = Query(1, ge=1, description="Page number"),
     items_per_page: int = Query(100, ge=1, le=500, description="Items per page"),
+    name_prefix: Optional[str] = Query(
+        None, description="Only return projects on this page whose name starts with this prefix"
+    ),
 ) -> Dict[str, Any]:
     """
     List all MongoDB Atlas projects.
@@ -21,16 +24,30 @@ async def list_projects(
     Args:
         page_num: Page number (1-indexed)
         items_per_page: Number of items per page (max 500)
+        name_prefix: Optional project name prefix to filter on. The filter
+            applies to the requested page only; totalCount stays Atlas's
+            count of all projects so paging still works, and filteredCount
+            gives the number of matches on this page
 
     Returns:
         Projects list with pagination info
     """
     try:
         async with AtlasClient() as client:
-            return await client.list_projects(page_num=page_num, items_per_page=items_per_page)
+            result = await client.list_projects(page_num=page_num, items_per_page=items_per_page)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+    # The Atlas API has no prefix filter, so filter here to avoid sending
+    # unrelated projects to the caller
+    if name_prefix:
+        result["results"] = [
+            project for project in result.get("results", [])
+            if project.get("name", "").startswith(name_prefix)
+        ]
+        result["filteredCount"] = len(result["results"])
+    return result
+
 
 @router.post("/")
 async def create_project(
@@ -2,12 +2,26 @@
 Base client for MongoDB Atlas API.
 """
 
+import importlib.util
 import httpx
-from typing import Any, Dict, Optional, List, Union
+import time
+from typing import Any, Dict, Optional, List, Tuple, Union
 from atlasui.client.auth import DigestAuth
 from atlasui.client.service_account import ServiceAccountAuth, ServiceAccountManager
 from atlasui.config import settings
 
+# httpx needs the optional h2 package (the "http2" extra) for HTTP/2
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def _copy_json(value: Any) -> Any:
+    """Copy the dicts and lists of decoded JSON; leaf values are shared."""
+    if isinstance(value, dict):
+        return {key: _copy_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(item) for item in value]
+    return value
+
 
 class AtlasClient:
     """
@@ -26,6 +40,7 @@ class AtlasClient:
         auth_method: Optional[str] = None,
         base_url: Optional[str] = None,
         timeout: Optional[int] = None,
+        cache_ttl: float = 0.0,
     ) -> None:
         """
         Initialize the Atlas API client.
@@ -39,10 +54,16 @@ class AtlasClient:
             auth_method: Authentication method ("api_key" or "service_account")
             base_url: Base URL for Atlas API (defaults to settings)
             timeout: Request timeout in seconds (defaults to settings)
+            cache_ttl: Seconds to reuse project and cluster listings; 0 (the
+                default) disables the cache so long-lived clients and pollers
+                always see current state
         """
         self.base_url = base_url or settings.atlas_api_base_url
         self.timeout = timeout or settings.timeout
         self.auth_method = auth_method or settings.atlas_auth_method
+        self.cache_ttl = cache_ttl
+        # (resource, endpoint, params) -> (fetched_at, response)
+        self._cache: Dict[Tuple[str, str, Tuple[Any, ...]], Tuple[float, Dict[str, Any]]] = {}
 
         # Determine authentication method and create appropriate auth handler
         auth: Union[DigestAuth, ServiceAccountAuth]
@@ -86,9 +107,15 @@ class AtlasClient:
 
         # Create HTTP client with the appropriate auth
         # Using 2024-11-13 API version (required for Flex clusters as of Jan 2025)
+        # Keep-alive pool sized so concurrent polls reuse TLS connections
         self.client = httpx.AsyncClient(
             auth=auth,
             timeout=self.timeout,
+            http2=settings.http2 and HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=settings.http_max_connections,
+                max_keepalive_connections=settings.http_max_keepalive,
+            ),
             headers={
                 "Accept": "application/vnd.atlas.2024-11-13+json",
                 "Content-Type": "application/json",
@@ -171,6 +198,46 @@ class AtlasClient:
 
         return response.json()
 
+    async def _cached_get(
+        self, resource: str, endpoint: str, params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        GET a listing endpoint, reusing a response younger than cache_ttl.
+
+        Args:
+            resource: Cache group the endpoint belongs to ("projects" or "clusters")
+            endpoint: API endpoint path
+            params: Query parameters
+
+        Returns:
+            Response JSON data; cache hits return a fresh copy, so callers
+            may modify the result without changing later hits
+        """
+        key = (resource, endpoint, tuple(sorted(params.items())))
+        now = time.monotonic()
+        cached = self._cache.get(key)
+        if cached is not None and now - cached[0] < self.cache_ttl:
+            hit: Dict[str, Any] = _copy_json(cached[1])
+            return hit
+
+        result = await self.get(endpoint, params=params)
+        if self.cache_ttl > 0:
+            self._cache[key] = (now, _copy_json(result))
+        return result
+
+    def invalidate(self, resource: Optional[str] = None) -> None:
+        """
+        Drop cached listings so the next call refetches.
+
+        Args:
+            resource: "projects" or "clusters"; None drops everything
+        """
+        if resource is None:
+            self._cache.clear()
+            return
+        for key in [key for key in self._cache if key[0] == resource]:
+            del self._cache[key]
+
     async def get(
         self, endpoint: str, params: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
@@ -229,9 +296,10 @@ class AtlasClient:
         Returns:
             Projects list response
         """
-        return await self.get(
+        return await self._cached_get(
+            "projects",
             "/groups",
-            params={"pageNum": page_num, "itemsPerPage": items_per_page}
+            {"pageNum": page_num, "itemsPerPage": items_per_page}
         )
 
     async def get_project(self, project_id: str) -> Dict[str, Any]:
@@ -260,7 +328,9 @@ class AtlasClient:
             Created project details
         """
         payload = {"name": name, "orgId": org_id}
-        return await self.post("/groups", json=payload)
+        result = await self.post("/groups", json=payload)
+        self.invalidate("projects")
+        return result
 
     async def delete_project(self, project_id: str) -> Dict[str, Any]:
         """
@@ -272,7 +342,9 @@ class AtlasClient:
         Returns:
             Deletion response
         """
-        return await self.delete(f"/groups/{project_id}")
+        result = await self.delete(f"/groups/{project_id}")
+        self.invalidate()
+        return result
 
     async def list_clusters(
         self, project_id: str, page_num: int = 1, items_per_page: int = 100
@@ -288,9 +360,10 @@ class AtlasClient:
         Returns:
             Clusters list response
         """
-        return await self.get(
+        return await self._cached_get(
+            "clusters",
             f"/groups/{project_id}/clusters",
-            params={"pageNum": page_num, "itemsPerPage": items_per_page}
+            {"pageNum": page_num, "itemsPerPage": items_per_page}
         )
 
     async def get_cluster(self, project_id: str, cluster_name: str) -> Dict[str, Any]:
@@ -319,7 +392,9 @@ class AtlasClient:
         Returns:
             Created cluster details
         """
-        return await self.post(f"/groups/{project_id}/clusters", json=cluster_config)
+        result = await self.post(f"/groups/{project_id}/clusters", json=cluster_config)
+        self.invalidate("clusters")
+        return result
 
     async def create_flex_cluster(
         self, project_id: str, cluster_config: Dict[str, Any]
@@ -337,7 +412,9 @@ class AtlasClient:
         Returns:
             Created Flex cluster details
         """
-        return await self.post(f"/groups/{project_id}/flexClusters", json=cluster_config)
+        result = await self.post(f"/groups/{project_id}/flexClusters", json=cluster_config)
+        self.invalidate("clusters")
+        return result
 
     async def list_flex_clusters(
         self, project_id: str, page_num: int = 1, items_per_page: int = 100
@@ -355,9 +432,10 @@ class AtlasClient:
         Returns:
             Flex clusters list response
         """
-        return await self.get(
+        return await self._cached_get(
+            "clusters",
             f"/groups/{project_id}/flexClusters",
-            params={"pageNum": page_num, "itemsPerPage": items_per_page}
+            {"pageNum": page_num, "itemsPerPage": items_per_page}
         )
 
     async def get_flex_cluster(self, project_id: str, cluster_name: str) -> Dict[str, Any]:
@@ -387,9 +465,11 @@ class AtlasClient:
         Returns:
             Updated cluster details
         """
-        return await self.patch(
+        result = await self.patch(
             f"/groups/{project_id}/clusters/{cluster_name}", json=cluster_config
         )
+        self.invalidate("clusters")
+        return result
 
     async def pause_cluster(self, project_id: str, cluster_name: str) -> Dict[str, Any]:
         """
@@ -406,10 +486,12 @@ class AtlasClient:
         Returns:
             Updated cluster details with paused=True
         """
-        return await self.patch(
+        result = await self.patch(
             f"/groups/{project_id}/clusters/{cluster_name}",
             json={"paused": True}
         )
+        self.invalidate("clusters")
+        return result
 
     async def resume_cluster(self, project_id: str, cluster_name: str) -> Dict[str, Any]:
         """
@@ -424,10 +506,12 @@ class AtlasClient:
         Returns:
             Updated cluster details with paused=False
         """
-        return await self.patch(
+        result = await self.patch(
             f"/groups/{project_id}/clusters/{cluster_name}",
             json={"paused": False}
         )
+        self.invalidate("clusters")
+        return result
 
     async def delete_cluster(self, project_id: str, cluster_name: str) -> Dict[str, Any]:
         """
@@ -440,7 +524,9 @@ class AtlasClient:
         Returns:
             Deletion response
         """
-        return await self.delete(f"/groups/{project_id}/clusters/{cluster_name}")
+        result = await self.delete(f"/groups/{project_id}/clusters/{cluster_name}")
+        self.invalidate("clusters")
+        return result
 
     async def delete_flex_cluster(self, project_id: str, cluster_name: str) -> Dict[str, Any]:
         """
@@ -453,7 +539,9 @@ class AtlasClient:
         Returns:
             Deletion response
         """
-        return await self.delete(f"/groups/{project_id}/flexClusters/{cluster_name}")
+        result = await self.delete(f"/groups/{project_id}/flexClusters/{cluster_name}")
+        self.invalidate("clusters")
+        return result
 
     async def list_organizations(
         self, page_num: int = 1, items_per_page: int = 100
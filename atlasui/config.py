@@ -2,8 +2,9 @@
 Configuration management for AtlasUI using Pydantic Settings.
 """
 
+from functools import lru_cache
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import Optional
+from typing import Any, Optional
 from pathlib import Path
 
 try:
@@ -57,10 +58,15 @@ class Settings(BaseSettings):
     host: str = "0.0.0.0"
     port: int = 8000
     reload: bool = False
+    ready_fd: Optional[int] = None  # Write one byte here once listening (atlasui start --ready-fd)
 
     # API Client Configuration
     timeout: int = 30
     max_retries: int = 3
+    http_max_connections: int = 100
+    http_max_keepalive: int = 20
+    # Only takes effect when the h2 package is installed (pip install atlasui[http2])
+    http2: bool = True
 
     # User Preferences
     preferred_cloud_provider: Optional[str] = None  # AWS, GCP, AZURE
@@ -106,6 +112,25 @@ class Settings(BaseSettings):
 settings = Settings()
 
 
+@lru_cache(maxsize=8)
+def get_settings(**overrides: Any) -> Settings:
+    """
+    Get a Settings instance for the given field overrides, built once and reused.
+
+    Building Settings re-reads the environment and .env file and validates
+    every field, so callers that need the same configuration repeatedly
+    should use this instead of constructing Settings directly. The returned
+    instance is shared and must be treated as read-only.
+
+    Args:
+        **overrides: Field values that take precedence over the environment
+
+    Returns:
+        Cached Settings instance (cleared by reload_settings())
+    """
+    return Settings(**overrides)
+
+
 def reload_settings() -> Settings:
     """
     Reload settings from environment and .env file.
@@ -119,4 +144,5 @@ def reload_settings() -> Settings:
     # Force Pydantic to reload by creating a new instance
     # This will re-read the .env file
     settings = Settings()
+    get_settings.cache_clear()
     return settings
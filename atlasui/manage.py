@@ -97,8 +97,16 @@ def is_port_in_use(port: int) -> bool:
         return False
 
 
-def start_server() -> int:
-    """Start the AtlasUI server."""
+def start_server(ready_fd: Optional[int] = None) -> int:
+    """
+    Start the AtlasUI server.
+
+    Args:
+        ready_fd: Optional inherited file descriptor that the server writes
+            one byte to once it is accepting connections. When given, the
+            caller waits on it, so this command returns without the usual
+            start-up delay.
+    """
     if is_running():
         print_msg(Colors.YELLOW, f"⚠️  Server is already running (PID: {get_pid()})")
         return 1
@@ -117,6 +125,10 @@ def start_server() -> int:
     print_msg(Colors.BLUE, f"   Port: {PORT}")
     print_msg(Colors.BLUE, f"   Log: {LOG_FILE}")
 
+    env = {**os.environ, "HOST": HOST, "PORT": str(PORT)}
+    if ready_fd is not None:
+        env["READY_FD"] = str(ready_fd)
+
     # Start server in background
     try:
         with open(LOG_FILE, 'w') as log:
@@ -125,14 +137,17 @@ def start_server() -> int:
                 stdout=log,
                 stderr=subprocess.STDOUT,
                 start_new_session=True,  # Detach from parent
-                env={**os.environ, "HOST": HOST, "PORT": str(PORT)}
+                env=env,
+                pass_fds=(ready_fd,) if ready_fd is not None else ()
             )
 
         # Save PID
         PID_FILE.write_text(str(process.pid))
 
-        # Wait a moment and check if it started successfully
-        time.sleep(2)
+        # Wait a moment and check if it started successfully. With a
+        # ready_fd the caller waits for the readiness byte instead.
+        if ready_fd is None:
+            time.sleep(2)
 
         if is_running():
             print_msg(Colors.GREEN, f"✓ Server started successfully (PID: {process.pid})")
@@ -278,6 +293,14 @@ atlasui version {__version__}
         help=f'Server port (default: {default_port})'
     )
 
+    parser.add_argument(
+        '--ready-fd',
+        type=int,
+        default=None,
+        help='Inherited file descriptor to write one byte to once the server '
+             'is accepting connections (start only)'
+    )
+
     args = parser.parse_args()
 
     # Update globals with command-line args
@@ -286,7 +309,7 @@ atlasui version {__version__}
     PORT = args.port
 
     commands = {
-        'start': start_server,
+        'start': lambda: start_server(ready_fd=args.ready_fd),
         'stop': stop_server,
         'restart': restart_server,
         'status': show_status,
@@ -3,6 +3,8 @@ FastAPI server for AtlasUI web interface.
 """
 
 import asyncio
+import os
+import socket
 import uvicorn
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
@@ -12,6 +14,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import Response
 from pathlib import Path
+from typing import List, Optional
 
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
@@ -179,14 +182,45 @@ app.include_router(server.router, prefix="/api/server", tags=["Server"])
 app.include_router(pages.router, tags=["Pages"])
 
 
-@app.get("/health")
+@app.api_route("/health", methods=["GET", "HEAD"])
 async def health_check():
-    """Health check endpoint."""
+    """Health check endpoint (HEAD is supported for cheap readiness probes)."""
     return {"status": "healthy", "version": settings.app_version}
 
 
+class ReadyNotifyingServer(uvicorn.Server):
+    """
+    uvicorn server that signals readiness over a file descriptor.
+
+    Once the listening socket is bound (and the lifespan startup has run)
+    a single byte is written to ``ready_fd`` and the descriptor is closed,
+    so a supervising process can wait on a pipe instead of polling /health.
+    """
+
+    def __init__(self, config: uvicorn.Config, ready_fd: int) -> None:
+        super().__init__(config)
+        self.ready_fd = ready_fd
+
+    async def startup(self, sockets: Optional[List[socket.socket]] = None) -> None:
+        try:
+            await super().startup(sockets=sockets)
+            if self.started:
+                os.write(self.ready_fd, b"1")
+        finally:
+            os.close(self.ready_fd)
+
+
 def main() -> None:
     """Run the FastAPI server."""
+    if settings.ready_fd is not None and not settings.reload:
+        config = uvicorn.Config(
+            "atlasui.server:app",
+            host=settings.host,
+            port=settings.port,
+        )
+        ReadyNotifyingServer(config, settings.ready_fd).run()
+        return
+
     uvicorn.run(
         "atlasui.server:app",
         host=settings.host,
@@ -48,6 +48,60 @@ def test(c, verbose=True, coverage=True):
     c.run(" ".join(cmd_parts))
 
 
+@task
+def test_unit(c, workers="auto", verbose=False):
+    """
+    Run the unit tests (no Atlas credentials, server or browser) in parallel.
+
+    Uses pytest-xdist with --dist loadfile so each test module stays on one
+    worker. Integration and browser suites are excluded: their session
+    fixtures create Atlas projects and clusters and must run in a single
+    process.
+
+    Args:
+        workers: Number of xdist workers (default: auto = one per CPU)
+        verbose: Run tests in verbose mode (default: False)
+    """
+    print("Running unit tests in parallel...")
+    cmd_parts = [
+        "uv", "run", "pytest", "tests/",
+        "-m", '"not integration and not browser"',
+        "-n", str(workers), "--dist", "loadfile",
+    ]
+
+    if verbose:
+        cmd_parts.append("-v")
+
+    c.run(" ".join(cmd_parts))
+
+
+@task
+def test_integration(c, workers="auto", verbose=False):
+    """
+    Run the read-only Atlas API integration tests in parallel.
+
+    tests/test_integration.py only reads from Atlas (get_* and list_*), so
+    its classes can run concurrently. --dist loadscope keeps each class on
+    one worker so class-scoped fixtures are resolved once; the session
+    listings (all_projects, all_organizations) are fetched once per worker.
+
+    Args:
+        workers: Number of xdist workers (default: auto = one per CPU)
+        verbose: Run tests in verbose mode (default: False)
+    """
+    print("Running Atlas API integration tests in parallel...")
+    cmd_parts = [
+        "uv", "run", "pytest", "tests/test_integration.py",
+        "-m", "integration",
+        "-n", str(workers), "--dist", "loadscope",
+    ]
+
+    if verbose:
+        cmd_parts.append("-v")
+
+    c.run(" ".join(cmd_parts))
+
+
 @task
 def m10_test(c, verbose=True):
     """
@@ -25,29 +25,65 @@ import argparse
 import sys
 import time
 import httpx
-from typing import List, Dict, Any, Optional
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
+
+try:
+    from tests.http_retry import retry_transient
+except ImportError:  # Run directly as: python tests/cleanup_test_resources.py
+    from http_retry import retry_transient
 
 
 BASE_URL = "http://localhost:8100"
 TEST_PROJECT_PREFIX = "test-session-"
 DELETION_TIMEOUT = 600  # 10 minutes
 
+_SESSION: Optional[httpx.Client] = None
+
 
 def _log(msg: str) -> None:
     """Print message with flush."""
     print(msg, flush=True)
 
 
-def get_all_projects() -> List[Dict[str, Any]]:
-    """Get all projects from Atlas."""
+def _session() -> httpx.Client:
+    """Return the shared HTTP client, creating it on first use."""
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = httpx.Client()
+    return _SESSION
+
+
+@retry_transient()
+def _request(method: str, url: str, **kwargs: Any) -> httpx.Response:
+    """Send a request on the shared client, retrying transient connection errors."""
+    return _session().request(method, url, **kwargs)
+
+
+def get_all_projects(name_prefix: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Get all projects from Atlas.
+
+    If name_prefix is given the server filters the list. Servers that reject
+    the parameter with a 4xx are retried without it.
+    """
+    params = {"name_prefix": name_prefix} if name_prefix else None
     try:
-        response = httpx.get(
+        response = _request(
+            "GET",
             f"{BASE_URL}/api/projects/",
+            params=params,
             timeout=30.0,
             follow_redirects=True
         )
         response.raise_for_status()
-        return response.json().get("results", [])
+        return orjson.loads(response.content).get("results", [])
+    except httpx.HTTPStatusError as e:
+        if name_prefix and 400 <= e.response.status_code < 500:
+            return get_all_projects()
+        _log(f"Error fetching projects: {e}")
+        return []
     except Exception as e:
         _log(f"Error fetching projects: {e}")
         return []
@@ -55,10 +91,13 @@ def get_all_projects() -> List[Dict[str, Any]]:
 
 def get_test_projects() -> List[Dict[str, Any]]:
     """Get all test projects (matching test-session-* pattern)."""
-    all_projects = get_all_projects()
+    all_projects = get_all_projects(name_prefix=TEST_PROJECT_PREFIX)
+    # Servers without prefix support return every project, so keep the
+    # client-side check as a single-pass filter
+    prefix = TEST_PROJECT_PREFIX
     return [
         proj for proj in all_projects
-        if proj.get("name", "").startswith(TEST_PROJECT_PREFIX)
+        if (name := proj.get("name")) is not None and name.startswith(prefix)
     ]
 
 
@@ -68,13 +107,14 @@ def get_clusters_in_project(project_id: str) -> List[Dict[str, Any]]:
 
     # Get regular clusters
     try:
-        response = httpx.get(
+        response = _request(
+            "GET",
             f"{BASE_URL}/api/clusters/{project_id}",
             timeout=30.0,
             follow_redirects=True
         )
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             for cluster in data.get("results", []):
                 clusters.append({
                     "name": cluster.get("name"),
@@ -86,13 +126,14 @@ def get_clusters_in_project(project_id: str) -> List[Dict[str, Any]]:
 
     # Get flex clusters
     try:
-        response = httpx.get(
+        response = _request(
+            "GET",
             f"{BASE_URL}/api/clusters/{project_id}/flex/list",
             timeout=30.0,
             follow_redirects=True
         )
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             for cluster in data.get("results", []):
                 clusters.append({
                     "name": cluster.get("name"),
@@ -105,10 +146,34 @@ def get_clusters_in_project(project_id: str) -> List[Dict[str, Any]]:
     return clusters
 
 
+def get_projects_with_clusters(
+    projects: List[Dict[str, Any]]
+) -> Dict[str, Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+    """
+    Fetch the clusters of several projects in parallel.
+
+    Returns:
+        Map of project ID to (project, clusters), in the order given
+    """
+    if not projects:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=min(len(projects), 8)) as executor:
+        cluster_lists = executor.map(
+            get_clusters_in_project,
+            [proj.get("id") for proj in projects]
+        )
+        return {
+            proj.get("id"): (proj, clusters)
+            for proj, clusters in zip(projects, cluster_lists)
+        }
+
+
 def delete_project(project_id: str) -> bool:
     """Delete a project (cascade deletes all clusters)."""
     try:
-        response = httpx.delete(
+        response = _request(
+            "DELETE",
             f"{BASE_URL}/api/projects/{project_id}?confirmed=true",
             timeout=120.0,
             follow_redirects=True
@@ -124,7 +189,8 @@ def wait_for_project_deleted(project_id: str, timeout: int = DELETION_TIMEOUT) -
     start_time = time.time()
     while time.time() - start_time < timeout:
         try:
-            response = httpx.get(
+            response = _request(
+                "GET",
                 f"{BASE_URL}/api/projects/{project_id}",
                 timeout=30.0,
                 follow_redirects=True
@@ -153,13 +219,11 @@ def list_test_projects() -> None:
 
     _log(f"Found {len(test_projects)} test project(s):\n")
 
-    for proj in test_projects:
-        proj_id = proj.get("id")
+    for proj_id, (proj, clusters) in get_projects_with_clusters(test_projects).items():
         proj_name = proj.get("name")
         _log(f"Project: {proj_name}")
         _log(f"  ID: {proj_id}")
 
-        clusters = get_clusters_in_project(proj_id)
         if clusters:
             _log(f"  Clusters ({len(clusters)}):")
             for cluster in clusters:
@@ -177,12 +241,13 @@ def clean_test_projects(force: bool = False) -> None:
         _log("No test projects found to clean up.")
         return
 
+    # Fetch every project's clusters once and reuse them below
+    projects_with_clusters = get_projects_with_clusters(test_projects)
+
     # Show what will be deleted
     _log(f"Found {len(test_projects)} test project(s) to delete:\n")
-    for proj in test_projects:
+    for proj_id, (proj, clusters) in projects_with_clusters.items():
         proj_name = proj.get("name")
-        proj_id = proj.get("id")
-        clusters = get_clusters_in_project(proj_id)
         _log(f"  - {proj_name} (ID: {proj_id})")
         if clusters:
             _log(f"    Clusters: {', '.join(c['name'] for c in clusters)}")
@@ -197,10 +262,9 @@ def clean_test_projects(force: bool = False) -> None:
 
     # Delete projects
     _log("\nDeleting test projects...")
-    for proj in test_projects:
+    for proj_id, (proj, clusters) in projects_with_clusters.items():
         proj_name = proj.get("name")
-        proj_id = proj.get("id")
-        _log(f"\n  Deleting {proj_name}...")
+        _log(f"\n  Deleting {proj_name} ({len(clusters)} cluster(s))...")
 
         if delete_project(proj_id):
             _log("    Deletion initiated, waiting for completion...")
@@ -218,7 +282,8 @@ def clean_project_by_id(project_id: str, force: bool = False) -> None:
     """Delete a specific project by ID."""
     # Verify project exists
     try:
-        response = httpx.get(
+        response = _request(
+            "GET",
             f"{BASE_URL}/api/projects/{project_id}",
             timeout=30.0,
             follow_redirects=True
@@ -226,7 +291,7 @@ def clean_project_by_id(project_id: str, force: bool = False) -> None:
         if response.status_code == 404:
             _log(f"Project {project_id} not found.")
             return
-        project = response.json()
+        project = orjson.loads(response.content)
         proj_name = project.get("name", "Unknown")
     except Exception as e:
         _log(f"Error fetching project: {e}")
@@ -290,28 +355,33 @@ def main() -> None:
 
     args = parser.parse_args()
 
-    # Check that server is running
     try:
-        response = httpx.get(f"{BASE_URL}/health", timeout=2.0)
-        if response.status_code != 200:
-            _log(f"Error: AtlasUI server not responding at {BASE_URL}")
+        # Check that server is running (on the shared client, so the
+        # connection is reused by the commands below)
+        try:
+            response = _session().head(f"{BASE_URL}/health", timeout=2.0)
+            if response.status_code != 200:
+                _log(f"Error: AtlasUI server not responding at {BASE_URL}")
+                _log("Start the server with: atlasui start --port 8100")
+                sys.exit(1)
+        except httpx.HTTPError:
+            _log(f"Error: Cannot connect to AtlasUI server at {BASE_URL}")
             _log("Start the server with: atlasui start --port 8100")
             sys.exit(1)
-    except Exception:
-        _log(f"Error: Cannot connect to AtlasUI server at {BASE_URL}")
-        _log("Start the server with: atlasui start --port 8100")
-        sys.exit(1)
-
-    # Execute command
-    if args.list:
-        list_test_projects()
-    elif args.clean:
-        clean_test_projects(force=args.force)
-    elif args.project_id:
-        clean_project_by_id(args.project_id, force=args.force)
-    else:
-        parser.print_help()
-        sys.exit(1)
+
+        # Execute command
+        if args.list:
+            list_test_projects()
+        elif args.clean:
+            clean_test_projects(force=args.force)
+        elif args.project_id:
+            clean_project_by_id(args.project_id, force=args.force)
+        else:
+            parser.print_help()
+            sys.exit(1)
+    finally:
+        if _SESSION is not None:
+            _SESSION.close()
 
 
 if __name__ == "__main__":
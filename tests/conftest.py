@@ -11,8 +11,8 @@ Architecture:
     Session Start:
     1. Start AtlasUI server (atlasui_server fixture)
     2. Create test project (test_project fixture)
-    3. Create M0, M10, Flex clusters in parallel (test_clusters fixture)
-    4. Wait for all clusters to reach IDLE state
+    3. Create M0, M10, Flex clusters in parallel (cluster_futures fixture)
+    4. Wait for each cluster to reach IDLE state independently
 
     Test Execution:
     - Tests use m0_cluster, m10_cluster, flex_cluster fixtures
@@ -25,11 +25,14 @@ Architecture:
 
 Fixtures:
     atlasui_server   - Starts/stops the AtlasUI server
+    browser_context  - One Playwright browser context shared across the session
+    instrumented_page - New page in that context with console/network capture
     test_project     - Creates project, cleans up at end
-    test_clusters    - Creates M0, M10, Flex clusters in parallel
-    m0_cluster       - Returns M0 cluster info (or skips if creation failed)
-    m10_cluster      - Returns M10 cluster info (or skips if creation failed)
-    flex_cluster     - Returns Flex cluster info (or skips if creation failed)
+    cluster_futures  - Creates M0, M10, Flex clusters in parallel (one future each)
+    test_clusters    - Waits for all three clusters to reach IDLE
+    m0_cluster       - Waits for M0 only and returns its info (or skips if creation failed)
+    m10_cluster      - Waits for M10 only and returns its info (or skips if creation failed)
+    flex_cluster     - Waits for Flex only and returns its info (or skips if creation failed)
 
 Usage:
     # Run all cluster feature tests
@@ -37,19 +40,28 @@ Usage:
 
     # Run specific test
     uv run pytest tests/test_cluster_features.py::test_pause_resume_m10 -v -s
+
+    # Keep the project and clusters for the next run instead of deleting them
+    uv run pytest tests/test_cluster_features.py -v -s --reuse-clusters
 """
 
+import functools
+import os
 import pytest
-import pytest_asyncio
+import select
+import signal
 import sys
 import subprocess
+import threading
 import time
 import httpx
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Optional, Dict, Any
-from unittest.mock import Mock, patch
-from atlasui.client import AtlasClient
+import orjson
+from pathlib import Path
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait as futures_wait
+from typing import Optional, Dict, Any, List, Tuple
 from atlasui.config import settings
+from atlasui import manage
+from tests.http_retry import retry_after_seconds, retry_transient
 # ============================================================================
 # Test Execution Notes
 # ============================================================================
@@ -79,6 +91,21 @@ TEST_PROJECT_NAME = f"test-session-{int(time.time())}"
 CLUSTER_CREATION_TIMEOUT = 900  # 15 minutes
 CLUSTER_DELETION_TIMEOUT = 600  # 10 minutes
 
+# Project kept between sessions when running with --reuse-clusters
+REUSE_STATE_FILE = Path(__file__).resolve().parent.parent / ".pytest_atlasui_state.json"
+
+
+# Enough pooled connections for every fixture worker thread to poll at once
+HTTP_LIMITS = httpx.Limits(max_connections=16, max_keepalive_connections=16)
+
+_http_client: Optional[httpx.Client] = None
+_http_client_lock = threading.Lock()
+
+# Long-lived worker threads shared by every fixture: the three cluster
+# create-and-wait tasks plus short HTTP fan-outs (regular + flex list
+# fetches, parallel resumes), so no executor is spun up per phase or poll
+_SESSION_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="atlasui-fix")
+
 
 def _log(msg: str) -> None:
     """Print message and flush immediately."""
@@ -86,11 +113,51 @@ def _log(msg: str) -> None:
     sys.stdout.flush()
 
 
+def _pause(seconds: float, stop_event: Optional[threading.Event] = None) -> bool:
+    """Sleep between polls. Returns True if stop_event was set while sleeping."""
+    if stop_event is None:
+        time.sleep(seconds)
+        return False
+    return stop_event.wait(seconds)
+
+
+def _http() -> httpx.Client:
+    """
+    Return the shared HTTP client for the AtlasUI server, creating it on first use.
+
+    All helpers share one client so the poll loops, the cluster-list fan-out
+    and the project deletion reuse kept-alive connections instead of opening
+    a new connection per request. httpx.Client is safe to share between the
+    fixture worker threads; the lock only guards its creation. The client is
+    closed once at the end of the session by pytest_sessionfinish.
+
+    The client is bound to BASE_URL, so helpers pass paths such as
+    "/api/projects/" rather than full URLs.
+    """
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            _http_client = httpx.Client(
+                base_url=BASE_URL,
+                timeout=30.0,
+                # Failed connects are retried only by _request's
+                # retry_transient backoff, not again by the transport
+                limits=HTTP_LIMITS
+            )
+        return _http_client
+
+
+@retry_transient()
+def _request(method: str, url: str, **kwargs: Any) -> httpx.Response:
+    """Send a request on the shared client, retrying transient connection errors."""
+    return _http().request(method, url, **kwargs)
+
+
 def _get_organization_id() -> str:
     """Get the first organization ID from the API."""
-    response = httpx.get(f"{BASE_URL}/api/organizations/", timeout=30.0, follow_redirects=True)
+    response = _request("GET", "/api/organizations/", timeout=30.0, follow_redirects=True)
     response.raise_for_status()
-    data = response.json()
+    data = orjson.loads(response.content)
     orgs = data.get("results", [])
     if not orgs:
         raise ValueError("No organizations found in Atlas account")
@@ -99,15 +166,32 @@ def _get_organization_id() -> str:
 
 def _find_existing_project(project_name: str) -> Optional[str]:
     """Find an existing project by name and return its ID."""
-    response = httpx.get(f"{BASE_URL}/api/projects/", timeout=30.0, follow_redirects=True)
+    response = _request("GET", "/api/projects/", timeout=30.0, follow_redirects=True)
     response.raise_for_status()
-    projects = response.json().get("results", [])
+    projects = orjson.loads(response.content).get("results", [])
     for proj in projects:
         if proj["name"] == project_name:
             return proj["id"]
     return None
 
 
+def _project_exists(project_id: str) -> bool:
+    """Check whether a project still exists."""
+    response = _request("GET", f"/api/projects/{project_id}", timeout=30.0, follow_redirects=True)
+    return response.status_code == 200
+
+
+def _load_reusable_project() -> Optional[Dict[str, Any]]:
+    """Return the project recorded by a previous --reuse-clusters session, if it still exists."""
+    try:
+        state = orjson.loads(REUSE_STATE_FILE.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+    if not state.get("project_id") or not _project_exists(state["project_id"]):
+        return None
+    return state
+
+
 def _create_project(org_id: str, project_name: str) -> str:
     """Create a project and return its ID."""
     # Check if project already exists
@@ -116,14 +200,15 @@ def _create_project(org_id: str, project_name: str) -> str:
         _log(f"   Found existing project: {existing_id}")
         return existing_id
 
-    response = httpx.post(
-        f"{BASE_URL}/api/projects/",
+    response = _request(
+        "POST",
+        "/api/projects/",
         json={"name": project_name, "orgId": org_id},
         timeout=30.0,
         follow_redirects=True
     )
     response.raise_for_status()
-    data = response.json()
+    data = orjson.loads(response.content)
 
     if "operation_id" in data:
         time.sleep(5)
@@ -136,20 +221,57 @@ def _create_project(org_id: str, project_name: str) -> str:
 
 def _find_existing_cluster(project_id: str, cluster_name: str) -> Optional[Dict[str, Any]]:
     """Find an existing cluster by name and return its data."""
-    response = httpx.get(
-        f"{BASE_URL}/api/clusters/{project_id}/{cluster_name}",
+    response = _request(
+        "GET",
+        f"/api/clusters/{project_id}/{cluster_name}",
         timeout=30.0,
         follow_redirects=True
     )
     if response.status_code == 200:
-        return response.json()
+        return orjson.loads(response.content)
     return None
 
 
-def _create_m0_cluster(project_id: str, cluster_name: str) -> Dict[str, Any]:
+def _list_all_clusters(project_id: str) -> Dict[str, Dict[str, Any]]:
+    """
+    List all clusters (regular and flex) in a project in a single round.
+
+    The regular and flex list endpoints are queried in parallel and the results
+    are merged into a map keyed by cluster name, so callers can check for
+    existing clusters with a dict lookup instead of one GET per cluster.
+    """
+    def _fetch(path: str) -> list:
+        response = _request("GET", path, timeout=30.0, follow_redirects=True)
+        if response.status_code == 200:
+            return orjson.loads(response.content).get("results", [])
+        return []
+
+    regular = _SESSION_POOL.submit(_fetch, f"/api/clusters/{project_id}")
+    flex = _SESSION_POOL.submit(_fetch, f"/api/clusters/{project_id}/flex/list")
+    clusters = regular.result() + flex.result()
+
+    return {cluster["name"]: cluster for cluster in clusters if cluster.get("name")}
+
+
+def _lookup_existing_cluster(
+    project_id: str,
+    cluster_name: str,
+    existing_clusters: Optional[Dict[str, Dict[str, Any]]] = None
+) -> Optional[Dict[str, Any]]:
+    """Look up a cluster in a pre-fetched map, falling back to a single GET."""
+    if existing_clusters is not None:
+        return existing_clusters.get(cluster_name)
+    return _find_existing_cluster(project_id, cluster_name)
+
+
+def _create_m0_cluster(
+    project_id: str,
+    cluster_name: str,
+    existing_clusters: Optional[Dict[str, Dict[str, Any]]] = None
+) -> Dict[str, Any]:
     """Create an M0 (free tier) cluster."""
     # Check if cluster already exists
-    existing = _find_existing_cluster(project_id, cluster_name)
+    existing = _lookup_existing_cluster(project_id, cluster_name, existing_clusters)
     if existing:
         _log(f"   Found existing M0 cluster: {cluster_name}")
         return existing
@@ -171,20 +293,25 @@ def _create_m0_cluster(project_id: str, cluster_name: str) -> Dict[str, Any]:
         }]
     }
 
-    response = httpx.post(
-        f"{BASE_URL}/api/clusters/{project_id}",
+    response = _request(
+        "POST",
+        f"/api/clusters/{project_id}",
         json=cluster_config,
         timeout=60.0,
         follow_redirects=True
     )
     response.raise_for_status()
-    return response.json()
+    return orjson.loads(response.content)
 
 
-def _create_m10_cluster(project_id: str, cluster_name: str) -> Dict[str, Any]:
+def _create_m10_cluster(
+    project_id: str,
+    cluster_name: str,
+    existing_clusters: Optional[Dict[str, Dict[str, Any]]] = None
+) -> Dict[str, Any]:
     """Create an M10 (dedicated) cluster."""
     # Check if cluster already exists
-    existing = _find_existing_cluster(project_id, cluster_name)
+    existing = _lookup_existing_cluster(project_id, cluster_name, existing_clusters)
     if existing:
         _log(f"   Found existing M10 cluster: {cluster_name}")
         return existing
@@ -205,20 +332,26 @@ def _create_m10_cluster(project_id: str, cluster_name: str) -> Dict[str, Any]:
         }]
     }
 
-    response = httpx.post(
-        f"{BASE_URL}/api/clusters/{project_id}",
+    response = _request(
+        "POST",
+        f"/api/clusters/{project_id}",
         json=cluster_config,
         timeout=60.0,
         follow_redirects=True
     )
     response.raise_for_status()
-    return response.json()
+    return orjson.loads(response.content)
 
 
-def _create_flex_cluster(project_id: str, cluster_name: str) -> Dict[str, Any]:
+def _create_flex_cluster(
+    project_id: str,
+    cluster_name: str,
+    existing_clusters: Optional[Dict[str, Dict[str, Any]]] = None
+) -> Dict[str, Any]:
     """Create a Flex cluster using the dedicated Flex API endpoint."""
-    # Check if cluster already exists (try both regular and flex endpoints)
-    existing = _find_existing_cluster(project_id, cluster_name)
+    # Check if cluster already exists (the pre-fetched map covers both
+    # the regular and flex endpoints)
+    existing = _lookup_existing_cluster(project_id, cluster_name, existing_clusters)
     if existing:
         _log(f"   Found existing Flex cluster: {cluster_name}")
         return existing
@@ -233,28 +366,53 @@ def _create_flex_cluster(project_id: str, cluster_name: str) -> Dict[str, Any]:
         }
     }
 
-    response = httpx.post(
-        f"{BASE_URL}/api/clusters/{project_id}/flex",
+    response = _request(
+        "POST",
+        f"/api/clusters/{project_id}/flex",
         json=cluster_config,
         timeout=60.0,
         follow_redirects=True
     )
     response.raise_for_status()
-    return response.json()
+    return orjson.loads(response.content)
+
 
+def _wait_for_cluster_ready(
+    project_id: str,
+    cluster_name: str,
+    timeout: int = CLUSTER_CREATION_TIMEOUT,
+    stop_event: Optional[threading.Event] = None
+) -> bool:
+    """
+    Poll until cluster reaches IDLE state.
+
+    Uses conditional requests: the ETag from the last response is sent back
+    in If-None-Match, and a 304 reply means the cluster is unchanged so no
+    body needs to be transferred or decoded. Servers that do not send an
+    ETag simply get plain GETs.
 
-def _wait_for_cluster_ready(project_id: str, cluster_name: str, timeout: int = CLUSTER_CREATION_TIMEOUT) -> bool:
-    """Poll until cluster reaches IDLE state."""
+    Returns False on timeout, or as soon as stop_event is set.
+    """
     start_time = time.time()
+    etag = None
+    state = "UNKNOWN"
     while time.time() - start_time < timeout:
         try:
-            response = httpx.get(
-                f"{BASE_URL}/api/clusters/{project_id}/{cluster_name}",
+            headers = {"If-None-Match": etag} if etag else {}
+            response = _request(
+                "GET",
+                f"/api/clusters/{project_id}/{cluster_name}",
+                headers=headers,
                 timeout=30.0,
                 follow_redirects=True
             )
-            if response.status_code == 200:
-                data = response.json()
+            if response.status_code == 304:
+                # Cluster unchanged since the last poll, keep waiting
+                elapsed = int(time.time() - start_time)
+                _log(f"   {cluster_name}: {state} ({elapsed}s elapsed)")
+            elif response.status_code == 200:
+                etag = response.headers.get("ETag")
+                data = orjson.loads(response.content)
                 state = data.get("stateName", "UNKNOWN")
                 elapsed = int(time.time() - start_time)
                 _log(f"   {cluster_name}: {state} ({elapsed}s elapsed)")
@@ -265,23 +423,34 @@ def _wait_for_cluster_ready(project_id: str, cluster_name: str, timeout: int = C
         except httpx.HTTPStatusError as e:
             if e.response.status_code != 404:
                 _log(f"   {cluster_name} warning: {e}")
-        time.sleep(15)
+        if _pause(15, stop_event):
+            break
     return False
 
 
-def _wait_for_flex_cluster_ready(project_id: str, cluster_name: str, timeout: int = CLUSTER_CREATION_TIMEOUT) -> bool:
-    """Poll until Flex cluster reaches IDLE state using the Flex API endpoint."""
+def _wait_for_flex_cluster_ready(
+    project_id: str,
+    cluster_name: str,
+    timeout: int = CLUSTER_CREATION_TIMEOUT,
+    stop_event: Optional[threading.Event] = None
+) -> bool:
+    """
+    Poll until Flex cluster reaches IDLE state using the Flex API endpoint.
+
+    Returns False on timeout, or as soon as stop_event is set.
+    """
     start_time = time.time()
     while time.time() - start_time < timeout:
         try:
             # Flex clusters use the flex list endpoint - check if cluster exists and is ready
-            response = httpx.get(
-                f"{BASE_URL}/api/clusters/{project_id}/flex/list",
+            response = _request(
+                "GET",
+                f"/api/clusters/{project_id}/flex/list",
                 timeout=30.0,
                 follow_redirects=True
             )
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 clusters = data.get("results", [])
                 for cluster in clusters:
                     if cluster.get("name") == cluster_name:
@@ -304,15 +473,17 @@ def _wait_for_flex_cluster_ready(project_id: str, cluster_name: str, timeout: in
                 _log(f"   {cluster_name} warning: {e}")
         except Exception as e:
             _log(f"   {cluster_name} error: {e}")
-        time.sleep(15)
+        if _pause(15, stop_event):
+            break
     return False
 
 
 def _delete_cluster_api(project_id: str, cluster_name: str) -> bool:
     """Delete a cluster via API."""
     try:
-        response = httpx.delete(
-            f"{BASE_URL}/api/clusters/{project_id}/{cluster_name}",
+        response = _request(
+            "DELETE",
+            f"/api/clusters/{project_id}/{cluster_name}",
             timeout=60.0,
             follow_redirects=True
         )
@@ -325,8 +496,9 @@ def _delete_cluster_api(project_id: str, cluster_name: str) -> bool:
 def _delete_project_api(project_id: str) -> bool:
     """Delete a project via API (with confirmed=true to cascade delete clusters)."""
     try:
-        response = httpx.delete(
-            f"{BASE_URL}/api/projects/{project_id}?confirmed=true",
+        response = _request(
+            "DELETE",
+            f"/api/projects/{project_id}?confirmed=true",
             timeout=120.0,
             follow_redirects=True
         )
@@ -341,8 +513,9 @@ def _wait_for_project_deleted(project_id: str, timeout: int = 600) -> bool:
     start_time = time.time()
     while time.time() - start_time < timeout:
         try:
-            response = httpx.get(
-                f"{BASE_URL}/api/projects/{project_id}",
+            response = _request(
+                "GET",
+                f"/api/projects/{project_id}",
                 timeout=30.0,
                 follow_redirects=True
             )
@@ -365,15 +538,16 @@ def _wait_for_cluster_deleted(project_id: str, cluster_name: str, timeout: int =
     start_time = time.time()
     while time.time() - start_time < timeout:
         try:
-            response = httpx.get(
-                f"{BASE_URL}/api/clusters/{project_id}/{cluster_name}",
+            response = _request(
+                "GET",
+                f"/api/clusters/{project_id}/{cluster_name}",
                 timeout=30.0,
                 follow_redirects=True
             )
             if response.status_code == 404:
                 return True
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 state = data.get("stateName", "UNKNOWN")
                 _log(f"   {cluster_name}: {state}")
         except httpx.HTTPStatusError as e:
@@ -383,147 +557,75 @@ def _wait_for_cluster_deleted(project_id: str, cluster_name: str, timeout: int =
     return False
 
 
-def pytest_configure(config):
-    """Register custom markers."""
-    config.addinivalue_line(
-        "markers", "integration: mark test as integration test (requires valid API credentials)"
-    )
-    config.addinivalue_line(
-        "markers", "pause_resume: mark test as pause/resume functionality test"
-    )
-    config.addinivalue_line(
-        "markers", "restrictions: mark test as cluster restrictions test"
-    )
-    config.addinivalue_line(
-        "markers", "display: mark test as UI display test"
-    )
-    config.addinivalue_line(
-        "markers", "m0: mark test as M0 (Free Tier) cluster test"
-    )
-    config.addinivalue_line(
-        "markers", "m10: mark test as M10 (Dedicated) cluster test"
-    )
-    config.addinivalue_line(
-        "markers", "flex: mark test as Flex cluster test"
-    )
-    config.addinivalue_line(
-        "markers", "lifecycle: mark test as cluster lifecycle test"
+def pytest_sessionfinish(session, exitstatus):
+    """Close the shared HTTP client and session pool after all session fixtures have finished."""
+    global _http_client
+    _SESSION_POOL.shutdown(wait=True)
+    with _http_client_lock:
+        if _http_client is not None:
+            _http_client.close()
+            _http_client = None
+
+
+# Custom markers registered at startup as (name, description)
+MARKERS = (
+    ("integration", "mark test as integration test (requires valid API credentials)"),
+    ("pause_resume", "mark test as pause/resume functionality test"),
+    ("restrictions", "mark test as cluster restrictions test"),
+    ("display", "mark test as UI display test"),
+    ("m0", "mark test as M0 (Free Tier) cluster test"),
+    ("m10", "mark test as M10 (Dedicated) cluster test"),
+    ("flex", "mark test as Flex cluster test"),
+    ("lifecycle", "mark test as cluster lifecycle test"),
+)
+
+
+def pytest_addoption(parser):
+    """Register harness command-line options."""
+    parser.addoption(
+        "--reuse-clusters",
+        action="store_true",
+        default=os.environ.get("ATLASUI_REUSE") == "1",
+        help="Keep the test project and its clusters after the session and reuse "
+             "them next time (state in .pytest_atlasui_state.json; also ATLASUI_REUSE=1)"
     )
 
 
-@pytest.fixture(scope="session")
-def validate_credentials():
-    """
-    Validate that Atlas API credentials are configured and working.
-
-    This fixture runs once per test session and validates that:
-    1. API credentials are configured in environment
-    2. The credentials are valid and can authenticate to Atlas API
-
-    If validation fails, integration tests will be skipped.
-
-    Returns:
-        bool: True if credentials are valid, False otherwise
-    """
-    try:
-        # Check if credentials are configured
-        if settings.atlas_auth_method == "api_key":
-            if not settings.atlas_public_key or not settings.atlas_private_key:
-                print("\n⚠️  Atlas API keys not configured. Skipping integration tests.", file=sys.stderr)
-                print("   Set ATLAS_PUBLIC_KEY and ATLAS_PRIVATE_KEY environment variables.", file=sys.stderr)
-                return False
-        elif settings.atlas_auth_method == "service_account":
-            if not settings.atlas_service_account_credentials_file:
-                if not settings.atlas_service_account_id or not settings.atlas_service_account_secret:
-                    print("\n⚠️  Atlas service account credentials not configured. Skipping integration tests.", file=sys.stderr)
-                    return False
+def pytest_configure(config):
+    """Register custom markers."""
+    for name, description in MARKERS:
+        config.addinivalue_line("markers", f"{name}: {description}")
 
-        # Credentials are configured - integration tests can run
-        print("\n✓ Atlas credentials configured - integration tests enabled", file=sys.stderr)
-        return True
 
-    except Exception as e:
-        print(f"\n⚠️  Failed to validate Atlas credentials: {e}", file=sys.stderr)
-        return False
+# Credential, client and sample-data fixtures for unit and integration tests
+pytest_plugins = ["tests.shared_fixtures"]
 
 
-@pytest_asyncio.fixture
-async def atlas_client(validate_credentials):
+def _stop_server(process: subprocess.Popen, timeout: float = 10.0) -> None:
     """
-    Create a real Atlas API client for integration tests.
-
-    Requires valid credentials to be configured.
-    Skips test if credentials are not valid.
+    Stop a server started with `atlasui start`.
 
-    Note: This fixture uses function scope and creates a new client for each test.
-    Async integration tests should be run separately from browser tests to avoid
-    event loop conflicts.
+    `atlasui start` detaches the server and records its PID in the PID file,
+    so signal that process directly (SIGTERM, then SIGKILL after timeout)
+    instead of spawning a second `atlasui stop` CLI process.
     """
-    if not validate_credentials:
-        pytest.skip("Atlas API credentials not configured or invalid")
-
-    async with AtlasClient() as client:
-        yield client
-
-
-@pytest.fixture
-def mock_atlas_client():
-    """Create a mock Atlas client for unit testing."""
-    from unittest.mock import AsyncMock
-    with patch('atlasui.client.base.httpx.AsyncClient') as mock_client:
-        # Configure the mock to return AsyncMock for async methods
-        mock_instance = AsyncMock()
-        mock_client.return_value = mock_instance
-        yield mock_client
-
-
-@pytest.fixture
-def sample_project():
-    """Sample project data for testing."""
-    return {
-        "id": "5a0a1e7e0f2912c554080adc",
-        "name": "Test Project",
-        "orgId": "5a0a1e7e0f2912c554080abc",
-        "created": "2023-01-01T00:00:00Z",
-        "clusterCount": 2
-    }
-
-
-@pytest.fixture
-def sample_cluster():
-    """Sample cluster data for testing."""
-    return {
-        "name": "test-cluster",
-        "stateName": "IDLE",
-        "mongoDBVersion": "7.0.0",
-        "clusterType": "REPLICASET",
-        "providerSettings": {
-            "providerName": "AWS",
-            "regionName": "US_EAST_1",
-            "instanceSizeName": "M10"
-        },
-        "connectionStrings": {
-            "standard": "mongodb://test-cluster.mongodb.net:27017"
-        }
-    }
-
-
-@pytest.fixture
-def sample_projects_response(sample_project):
-    """Sample projects list response."""
-    return {
-        "results": [sample_project],
-        "totalCount": 1
-    }
-
+    pid = manage.get_pid()
+    if pid is not None:
+        try:
+            os.kill(pid, signal.SIGTERM)
+            deadline = time.monotonic() + timeout
+            while manage.is_running() and time.monotonic() < deadline:
+                time.sleep(0.05)
+            if manage.is_running():
+                os.kill(pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        manage.PID_FILE.unlink(missing_ok=True)
 
-@pytest.fixture
-def sample_clusters_response(sample_cluster):
-    """Sample clusters list response."""
-    return {
-        "results": [sample_cluster],
-        "totalCount": 1
-    }
+    try:
+        process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        process.kill()
 
 
 @pytest.fixture(scope="session")
@@ -547,7 +649,7 @@ def atlasui_server():
 
     # Check if server is already running
     try:
-        response = httpx.get("http://localhost:8100/health", timeout=2.0)
+        response = _http().head("/health", timeout=2.0)
         if response.status_code == 200:
             print("\n✓ AtlasUI server already running at http://localhost:8100", file=sys.stderr)
             yield
@@ -555,43 +657,111 @@ def atlasui_server():
     except (httpx.ConnectError, httpx.TimeoutException):
         pass
 
-    # Start the server on port 8100 for development/testing
+    # Start the server on port 8100 for development/testing. The server
+    # writes one byte to the pipe once it is listening; if it dies first,
+    # every write end is closed and the read sees EOF straight away.
     print("\n▶ Starting AtlasUI server on port 8100...", file=sys.stderr)
-    process = subprocess.Popen(
-        ["atlasui", "start", "--port", "8100"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True
-    )
+    ready_r, ready_w = os.pipe()
+    try:
+        process = subprocess.Popen(
+            ["atlasui", "start", "--port", "8100", "--ready-fd", str(ready_w)],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            pass_fds=(ready_w,)
+        )
+        os.close(ready_w)
 
-    # Wait for server to be ready (max 30 seconds)
-    max_wait = 30
-    start_time = time.time()
-    server_ready = False
+        # Wait for server to be ready (max 30 seconds)
+        readable, _, _ = select.select([ready_r], [], [], 30)
+        server_ready = bool(readable) and os.read(ready_r, 1) == b"1"
+    finally:
+        os.close(ready_r)
 
-    while time.time() - start_time < max_wait:
+    # Sanity check that the server answers now that it reports ready
+    if server_ready:
         try:
-            response = httpx.get("http://localhost:8100/health", timeout=2.0)
-            if response.status_code == 200:
-                server_ready = True
-                print("✓ AtlasUI server ready at http://localhost:8100", file=sys.stderr)
-                break
-        except (httpx.ConnectError, httpx.TimeoutException):
-            time.sleep(1)
+            server_ready = _http().head("/health", timeout=2.0).status_code == 200
+        except httpx.HTTPError:
+            server_ready = False
 
     if not server_ready:
-        process.kill()
+        _stop_server(process)
         raise RuntimeError("Failed to start AtlasUI server within 30 seconds")
+    print("✓ AtlasUI server ready at http://localhost:8100", file=sys.stderr)
 
     yield
 
     # Stop the server
     print("\n■ Stopping AtlasUI server...", file=sys.stderr)
-    subprocess.run(["atlasui", "stop"], capture_output=True)
-    process.wait(timeout=10)
+    _stop_server(process)
     print("✓ AtlasUI server stopped", file=sys.stderr)
 
 
+# Resource types no UI test looks at. Stylesheets are kept: visibility
+# checks depend on CSS (e.g. Bootstrap's d-none and modal classes).
+SKIPPED_RESOURCE_TYPES = {"image", "media", "font"}
+
+# Playwright waits fail after these many milliseconds instead of the 30s default
+PAGE_TIMEOUT_MS = 10000
+NAVIGATION_TIMEOUT_MS = 15000
+
+
+def _skip_heavy_resources(route) -> None:
+    """Abort image, media and font requests; let everything else through."""
+    if route.request.resource_type in SKIPPED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
+
+@pytest.fixture(scope="session")
+def browser_context(browser, browser_context_args):
+    """
+    One browser context shared by every test that uses instrumented_page.
+
+    pytest-playwright's `page` fixture opens a fresh context per test; tests
+    that only need a clean page (not clean cookies/storage) share this one
+    instead. Images, media and fonts are never fetched in it.
+    """
+    context = browser.new_context(**browser_context_args)
+    context.route("**/*", _skip_heavy_resources)
+    yield context
+    context.close()
+
+
+@pytest.fixture
+def instrumented_page(browser_context):
+    """
+    A new page in the shared context with console and network capture attached.
+
+    Yields:
+        Tuple of (page, capture) where capture holds the console_messages
+        and network_errors lists filled in by the page listeners
+    """
+    page = browser_context.new_page()
+    page.set_default_timeout(PAGE_TIMEOUT_MS)
+    page.set_default_navigation_timeout(NAVIGATION_TIMEOUT_MS)
+    capture: Dict[str, List[Dict[str, Any]]] = {
+        "console_messages": [],
+        "network_errors": [],
+    }
+
+    page.on("console", lambda msg: capture["console_messages"].append({
+        "type": msg.type,
+        "text": msg.text
+    }))
+    page.on("requestfailed", lambda request: capture["network_errors"].append({
+        "url": request.url,
+        "method": request.method,
+        "failure": request.failure
+    }))
+
+    yield page, capture
+
+    page.close()
+
+
 # ============================================================================
 # Session-scoped Cluster Fixtures
 # ============================================================================
@@ -604,78 +774,191 @@ M0_CLUSTER_NAME = "m0-cluster"
 M10_CLUSTER_NAME = "m10-cluster"
 FLEX_CLUSTER_NAME = "flex-cluster"
 
+# Short-lived cache of project cluster lists: project_id -> (fetched_at, result)
+CLUSTER_LIST_TTL = 2.0
+_cluster_list_cache: Dict[str, Tuple[float, Tuple[List[Dict[str, Any]], Optional[float]]]] = {}
+_cluster_list_cache_lock = threading.Lock()
 
-def _get_all_clusters_in_project(project_id: str) -> list:
-    """Get all clusters (regular and flex) in a project."""
-    clusters = []
+# Cap on concurrent resume requests, so a project with many paused
+# clusters does not fire them all at the server at once
+MAX_PARALLEL_RESUMES = 4
+_resume_slots = threading.Semaphore(MAX_PARALLEL_RESUMES)
 
-    # Get regular clusters
-    try:
-        response = httpx.get(
-            f"{BASE_URL}/api/clusters/{project_id}",
+# Longest time to follow a cluster event stream before re-polling (which
+# also retries any failed resumes) and subscribing again
+EVENT_STREAM_WINDOW = 60.0
+
+
+def _get_all_clusters_in_project(project_id: str) -> Tuple[List[Dict[str, Any]], Optional[float]]:
+    """
+    Get all clusters (regular and flex) in a project.
+
+    The regular and flex lists are fetched in parallel on the session pool.
+    Results are cached for CLUSTER_LIST_TTL seconds so callers polling in
+    the same tick share one fetch.
+
+    Returns:
+        Tuple of (clusters, retry_after) where retry_after is the largest
+        Retry-After hint in seconds from either response, or None
+
+    Raises:
+        httpx.HTTPError: If either list could not be fetched, so callers can
+            tell a failed poll apart from a project with no clusters
+    """
+    with _cluster_list_cache_lock:
+        cached = _cluster_list_cache.get(project_id)
+    if cached is not None and time.monotonic() - cached[0] < CLUSTER_LIST_TTL:
+        return cached[1]
+
+    def _fetch_regular() -> Tuple[List[Dict[str, Any]], Optional[float]]:
+        response = _request(
+            "GET",
+            f"/api/clusters/{project_id}",
             timeout=30.0,
             follow_redirects=True
         )
-        if response.status_code == 200:
-            data = response.json()
-            for cluster in data.get("results", []):
-                clusters.append({
-                    "name": cluster.get("name"),
-                    "state": cluster.get("stateName", "UNKNOWN"),
-                    "paused": cluster.get("paused", False),
-                    "type": "regular"
-                })
-    except Exception as e:
-        _log(f"   Warning getting regular clusters: {e}")
-
-    # Get flex clusters
-    try:
-        response = httpx.get(
-            f"{BASE_URL}/api/clusters/{project_id}/flex/list",
+        response.raise_for_status()
+        clusters = []
+        for cluster in orjson.loads(response.content).get("results", []):
+            clusters.append({
+                "name": cluster.get("name"),
+                "state": cluster.get("stateName", "UNKNOWN"),
+                "paused": cluster.get("paused", False),
+                "type": "regular"
+            })
+        return clusters, retry_after_seconds(response)
+
+    def _fetch_flex() -> Tuple[List[Dict[str, Any]], Optional[float]]:
+        response = _request(
+            "GET",
+            f"/api/clusters/{project_id}/flex/list",
             timeout=30.0,
             follow_redirects=True
         )
-        if response.status_code == 200:
-            data = response.json()
-            for cluster in data.get("results", []):
-                clusters.append({
-                    "name": cluster.get("name"),
-                    "state": cluster.get("stateName", "IDLE"),  # Flex clusters are typically IDLE
-                    "paused": False,  # Flex clusters can't be paused
-                    "type": "flex"
-                })
-    except Exception as e:
-        _log(f"   Warning getting flex clusters: {e}")
-
-    return clusters
+        response.raise_for_status()
+        clusters = []
+        for cluster in orjson.loads(response.content).get("results", []):
+            clusters.append({
+                "name": cluster.get("name"),
+                "state": cluster.get("stateName", "IDLE"),  # Flex clusters are typically IDLE
+                "paused": False,  # Flex clusters can't be paused
+                "type": "flex"
+            })
+        return clusters, retry_after_seconds(response)
+
+    regular = _SESSION_POOL.submit(_fetch_regular)
+    flex = _SESSION_POOL.submit(_fetch_flex)
+    regular_clusters, regular_hint = regular.result()
+    flex_clusters, flex_hint = flex.result()
+
+    hints = [hint for hint in (regular_hint, flex_hint) if hint is not None]
+    result = (regular_clusters + flex_clusters, max(hints) if hints else None)
+    with _cluster_list_cache_lock:
+        _cluster_list_cache[project_id] = (time.monotonic(), result)
+    return result
+
+
+def _invalidate_cluster_list(project_id: str) -> None:
+    """Drop the cached cluster list for a project after its state was changed."""
+    with _cluster_list_cache_lock:
+        _cluster_list_cache.pop(project_id, None)
 
 
 def _resume_cluster(project_id: str, cluster_name: str) -> bool:
-    """Resume a paused cluster."""
+    """Resume a paused cluster (at most MAX_PARALLEL_RESUMES run at once)."""
     try:
-        response = httpx.post(
-            f"{BASE_URL}/api/clusters/{project_id}/{cluster_name}/resume",
-            timeout=60.0,
-            follow_redirects=True
-        )
-        return response.status_code in [200, 202]
+        with _resume_slots:
+            response = _request(
+                "POST",
+                f"/api/clusters/{project_id}/{cluster_name}/resume",
+                timeout=60.0,
+                follow_redirects=True
+            )
+        if response.status_code in [200, 202]:
+            # Don't serve the cached "paused" state to the next poll
+            _invalidate_cluster_list(project_id)
+            return True
+        return False
     except Exception as e:
         _log(f"   Warning resuming {cluster_name}: {e}")
         return False
 
 
+def _stream_until_idle(project_id: str, deadline: float) -> Optional[bool]:
+    """
+    Follow the project's cluster event stream until every cluster is IDLE.
+
+    Args:
+        project_id: Project whose clusters to watch
+        deadline: time.time() value at which to stop listening
+
+    Returns:
+        True once the server reports all clusters idle, False if the deadline
+        passes first, or None if the stream is unavailable (callers should
+        fall back to polling)
+    """
+    event = None
+    try:
+        with _http().stream(
+            "GET",
+            f"/api/clusters/events/{project_id}",
+            params={"until_idle": "true"},
+            timeout=httpx.Timeout(30.0)
+        ) as response:
+            if response.status_code != 200:
+                return None
+            for line in response.iter_lines():
+                if line.startswith("event: "):
+                    event = line[len("event: "):]
+                elif line.startswith("data: "):
+                    if event == "idle":
+                        return True
+                    if event == "state":
+                        cluster = orjson.loads(line[len("data: "):])
+                        state = "PAUSED" if cluster["paused"] else cluster["stateName"]
+                        _log(f"   {cluster['name']}: {state}")
+                if time.time() >= deadline:
+                    return False
+    except httpx.HTTPError as e:
+        _log(f"   Cluster event stream unavailable, polling instead: {e}")
+        return None
+    return False
+
+
 def _wait_for_all_clusters_idle(project_id: str, timeout: int = 600) -> bool:
     """
     Wait for all clusters in a project to reach IDLE state.
 
     If any clusters are paused, resume them in parallel.
-    Polls every 10 seconds until all clusters are IDLE.
+    Polls with exponential backoff (2s growing to 15s) until all clusters
+    are IDLE; the delay resets to 2s whenever another cluster settles.
+    A Retry-After hint from the server (floored at 2s) takes precedence.
+
+    Between polls the server's cluster event stream is followed for up to
+    EVENT_STREAM_WINDOW seconds, so state changes arrive as they happen
+    instead of on the next poll. If the stream is unavailable the function
+    falls back to polling alone.
     """
     start_time = time.time()
     resumed_clusters = set()  # Track which clusters we've already resumed
+    delay = 2.0
+    pending_before = None  # Names of non-IDLE clusters on the previous poll
+    use_events = True
+    last_states: Dict[str, Tuple[str, bool]] = {}  # name -> (state, paused) last logged
+    next_summary = start_time + 60
 
     while time.time() - start_time < timeout:
-        clusters = _get_all_clusters_in_project(project_id)
+        try:
+            clusters, retry_after = _get_all_clusters_in_project(project_id)
+        except httpx.HTTPError as e:
+            # A failed poll says nothing about the clusters; back off and retry
+            _log(f"   Warning listing clusters: {e}")
+            retry_after = None
+            if isinstance(e, httpx.HTTPStatusError):
+                retry_after = retry_after_seconds(e.response)
+            time.sleep(max(retry_after, 2.0) if retry_after is not None else delay)
+            delay = min(delay * 1.5, 15.0)
+            continue
 
         if not clusters:
             _log("   No clusters found in project")
@@ -690,72 +973,114 @@ def _wait_for_all_clusters_idle(project_id: str, timeout: int = 600) -> bool:
         # Resume paused clusters in parallel
         if paused_to_resume:
             _log(f"   Resuming {len(paused_to_resume)} paused cluster(s) in parallel...")
-            with ThreadPoolExecutor(max_workers=len(paused_to_resume)) as executor:
-                futures = {}
-                for cluster in paused_to_resume:
-                    name = cluster["name"]
-                    _log(f"   {name}: PAUSED - initiating resume...")
-                    future = executor.submit(_resume_cluster, project_id, name)
-                    futures[future] = name
-
-                for future in as_completed(futures):
-                    name = futures[future]
-                    try:
-                        if future.result():
-                            resumed_clusters.add(name)
-                            _log(f"   {name}: Resume initiated")
-                    except Exception as e:
-                        _log(f"   {name}: Resume failed - {e}")
-
-        # Check if all clusters are now IDLE
-        all_idle = True
+            futures = {}
+            for cluster in paused_to_resume:
+                name = cluster["name"]
+                _log(f"   {name}: PAUSED - initiating resume...")
+                future = _SESSION_POOL.submit(_resume_cluster, project_id, name)
+                futures[future] = name
+
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    if future.result():
+                        resumed_clusters.add(name)
+                        _log(f"   {name}: Resume initiated")
+                except Exception as e:
+                    _log(f"   {name}: Resume failed - {e}")
+
+        if all(not c["paused"] and c["state"] == "IDLE" for c in clusters):
+            _log("   All clusters are in IDLE state")
+            return True
+
+        # Log state transitions only
+        pending = set()
+        now = time.time()
+        elapsed = int(now - start_time)
         for cluster in clusters:
             name = cluster["name"]
             state = cluster["state"]
             paused = cluster["paused"]
 
-            if paused:
-                elapsed = int(time.time() - start_time)
-                _log(f"   {name}: Still paused, waiting... ({elapsed}s elapsed)")
-                all_idle = False
-            elif state != "IDLE":
-                elapsed = int(time.time() - start_time)
-                _log(f"   {name}: {state} ({elapsed}s elapsed)")
-                all_idle = False
-
-        if all_idle:
-            _log("   All clusters are in IDLE state")
-            return True
+            if paused or state != "IDLE":
+                pending.add(name)
+
+            if last_states.get(name) != (state, paused):
+                if paused:
+                    _log(f"   {name}: Still paused, waiting... ({elapsed}s elapsed)")
+                elif state != "IDLE" or name in last_states:
+                    _log(f"   {name}: {state} ({elapsed}s elapsed)")
+                last_states[name] = (state, paused)
+
+        # One summary line a minute while nothing is changing
+        if now >= next_summary:
+            waiting_on = ", ".join(
+                f"{c['name']}={'PAUSED' if c['paused'] else c['state']}"
+                for c in clusters if c["name"] in pending
+            )
+            _log(f"   Still waiting ({elapsed}s elapsed): {waiting_on}")
+            next_summary = now + 60
+
+        # Poll quickly again right after progress, back off while nothing changes
+        if pending_before is not None and len(pending) < len(pending_before):
+            delay = 2.0
+        pending_before = pending
+
+        if use_events:
+            window_end = min(time.time() + EVENT_STREAM_WINDOW, start_time + timeout)
+            streamed = _stream_until_idle(project_id, window_end)
+            if streamed:
+                _log("   All clusters are in IDLE state")
+                return True
+            if streamed is not None:
+                # Window elapsed: re-poll right away, then listen again
+                continue
+            use_events = False
 
-        time.sleep(10)
+        time.sleep(max(retry_after, 2.0) if retry_after is not None else delay)
+        delay = min(delay * 1.5, 15.0)
 
     _log("   Timeout waiting for clusters to reach IDLE state")
     return False
 
 
 @pytest.fixture(scope="session")
-def test_project(atlasui_server):
+def test_project(request, atlasui_server):
     """
     Session-scoped fixture that creates a test project for all Playwright tests.
 
     The project is created once at the start of the session and deleted at the end.
     All test clusters will be created within this project.
+
+    With --reuse-clusters (or ATLASUI_REUSE=1) the project is recorded in
+    REUSE_STATE_FILE instead of being deleted, and the next session picks it
+    up again, so clusters that are still IDLE need no creation at all.
     """
+    reuse = request.config.getoption("--reuse-clusters")
+
     _log("\n" + "=" * 80)
     _log("Creating Test Project")
     _log("=" * 80)
 
-    org_id = _get_organization_id()
-    _log(f"   Organization ID: {org_id}")
-
-    project_id = _create_project(org_id, TEST_PROJECT_NAME)
+    state = _load_reusable_project() if reuse else None
+    if state:
+        org_id = state["org_id"]
+        project_id = state["project_id"]
+        project_name = state["project_name"]
+        _log(f"   Reusing project {project_name} from {REUSE_STATE_FILE.name}")
+    else:
+        org_id = _get_organization_id()
+        project_name = TEST_PROJECT_NAME
+        _log(f"   Organization ID: {org_id}")
+        project_id = _create_project(org_id, project_name)
     _log(f"   Project ID: {project_id}")
 
-    yield {
+    project = {
         "project_id": project_id,
-        "project_name": TEST_PROJECT_NAME,
+        "project_name": project_name,
         "org_id": org_id
     }
+    yield project
 
     # Cleanup: Wait for all clusters to reach IDLE state before deleting
     _log("\n" + "=" * 80)
@@ -765,7 +1090,12 @@ def test_project(atlasui_server):
     _log("   Waiting for all clusters to reach IDLE state...")
     _wait_for_all_clusters_idle(project_id)
 
-    _log(f"   Deleting project {TEST_PROJECT_NAME}...")
+    if reuse:
+        REUSE_STATE_FILE.write_bytes(orjson.dumps(project))
+        _log(f"   Keeping project {project_name} for reuse ({REUSE_STATE_FILE.name})")
+        return
+
+    _log(f"   Deleting project {project_name}...")
     if _delete_project_api(project_id):
         _log("   Project deletion initiated, waiting for completion...")
         if _wait_for_project_deleted(project_id):
@@ -776,16 +1106,46 @@ def test_project(atlasui_server):
         _log("   ⚠ Failed to initiate project deletion")
 
 
+def _create_and_wait(
+    cluster_type: str,
+    project_id: str,
+    cluster_name: str,
+    create_func,
+    wait_func,
+    existing_clusters: Dict[str, Dict[str, Any]],
+    stop_event: threading.Event
+) -> Dict[str, Any]:
+    """Create a cluster and block until it reaches IDLE state (or stop_event is set)."""
+    result = create_func(project_id, cluster_name, existing_clusters)
+    _log(f"   ✓ {cluster_type} cluster creation initiated: {cluster_name}")
+
+    if not wait_func(project_id, cluster_name, stop_event=stop_event):
+        if stop_event.is_set():
+            raise RuntimeError(f"{cluster_type} cluster wait cancelled")
+        raise TimeoutError(f"{cluster_type} cluster timed out waiting for IDLE")
+    _log(f"   ✓ {cluster_type} cluster is ready")
+
+    return {
+        "name": cluster_name,
+        "data": result
+    }
+
+
+def _log_cluster_failure(cluster_type: str, future: Future) -> None:
+    """Done-callback that reports a failed cluster as soon as it fails."""
+    if not future.cancelled() and future.exception() is not None:
+        _log(f"   ✗ {cluster_type} cluster error: {future.exception()}")
+
+
 @pytest.fixture(scope="session")
-def test_clusters(test_project, atlasui_server):
+def cluster_futures(test_project, atlasui_server):
     """
-    Session-scoped fixture that creates M0, M10, and Flex clusters in parallel.
+    Session-scoped fixture that starts creating M0, M10, and Flex clusters in parallel.
 
-    This fixture:
-    1. Creates all three cluster types in parallel (to save time)
-    2. Waits for all clusters to reach IDLE state
-    3. Returns cluster info for tests to use
-    4. Does NOT delete clusters (project deletion handles that)
+    Each cluster is created and waited on by its own task, so the returned
+    futures complete independently. Fixtures that need a single cluster type
+    block only on that cluster's future, which lets M0 tests start running
+    while the M10 cluster is still provisioning.
     """
     project_id = test_project["project_id"]
 
@@ -793,68 +1153,84 @@ def test_clusters(test_project, atlasui_server):
     _log("Creating Test Clusters (in parallel)")
     _log("=" * 80)
 
-    # Define cluster creation tasks
+    # Define cluster creation tasks: (type, name, create function, wait function)
     cluster_tasks = [
-        ("M0", M0_CLUSTER_NAME, _create_m0_cluster),
-        ("M10", M10_CLUSTER_NAME, _create_m10_cluster),
-        ("Flex", FLEX_CLUSTER_NAME, _create_flex_cluster),
+        ("M0", M0_CLUSTER_NAME, _create_m0_cluster, _wait_for_cluster_ready),
+        ("M10", M10_CLUSTER_NAME, _create_m10_cluster, _wait_for_cluster_ready),
+        ("Flex", FLEX_CLUSTER_NAME, _create_flex_cluster, _wait_for_flex_cluster_ready),
     ]
 
-    created_clusters = {}
-    failed_clusters = []
+    # Fetch the existing clusters once so each creation task can check for
+    # an existing cluster with a dict lookup
+    existing_clusters = _list_all_clusters(project_id)
+
+    # Set at teardown so waits that no test ended up needing stop polling
+    # instead of holding up the session for the rest of their timeout
+    stop_event = threading.Event()
 
-    # Create clusters in parallel
     _log("\n   Starting parallel cluster creation...")
-    with ThreadPoolExecutor(max_workers=3) as executor:
-        futures = {}
-        for cluster_type, cluster_name, create_func in cluster_tasks:
-            _log(f"   Initiating {cluster_type} cluster: {cluster_name}")
-            future = executor.submit(create_func, project_id, cluster_name)
-            futures[future] = (cluster_type, cluster_name)
-
-        for future in as_completed(futures):
-            cluster_type, cluster_name = futures[future]
-            try:
-                result = future.result()
-                created_clusters[cluster_type] = {
-                    "name": cluster_name,
-                    "data": result
-                }
-                _log(f"   ✓ {cluster_type} cluster creation initiated: {cluster_name}")
-            except Exception as e:
-                _log(f"   ✗ Failed to create {cluster_type} cluster: {e}")
-                failed_clusters.append(cluster_type)
+    futures = {}
+    for cluster_type, cluster_name, create_func, wait_func in cluster_tasks:
+        existing = existing_clusters.get(cluster_name)
+        if existing and existing.get("stateName") == "IDLE" and not existing.get("paused"):
+            # Already running (e.g. a reused project): nothing to create or wait for
+            _log(f"   ✓ {cluster_type} cluster already IDLE: {cluster_name}")
+            future = Future()
+            future.set_result({"name": cluster_name, "data": existing})
+            futures[cluster_type] = future
+            continue
+
+        _log(f"   Initiating {cluster_type} cluster: {cluster_name}")
+        future = _SESSION_POOL.submit(
+            _create_and_wait,
+            cluster_type,
+            project_id,
+            cluster_name,
+            create_func,
+            wait_func,
+            existing_clusters,
+            stop_event
+        )
+        future.add_done_callback(functools.partial(_log_cluster_failure, cluster_type))
+        futures[cluster_type] = future
 
-    # Wait for all clusters to be ready (in parallel)
-    _log("\n   Waiting for clusters to reach IDLE state...")
+    try:
+        yield {
+            "project_id": project_id,
+            "project_name": test_project["project_name"],
+            "org_id": test_project["org_id"],
+            "futures": futures
+        }
+    finally:
+        stop_event.set()
+        for future in futures.values():
+            future.cancel()
+        futures_wait(futures.values())
 
-    with ThreadPoolExecutor(max_workers=3) as executor:
-        futures = {}
-        for cluster_type, cluster_info in created_clusters.items():
-            # Use the correct waiting function based on cluster type
-            if cluster_type == "Flex":
-                wait_func = _wait_for_flex_cluster_ready
-            else:
-                wait_func = _wait_for_cluster_ready
-            future = executor.submit(
-                wait_func,
-                project_id,
-                cluster_info["name"]
-            )
-            futures[future] = cluster_type
-
-        for future in as_completed(futures):
-            cluster_type = futures[future]
-            try:
-                ready = future.result()
-                if ready:
-                    _log(f"   ✓ {cluster_type} cluster is ready")
-                else:
-                    _log(f"   ✗ {cluster_type} cluster timed out waiting for IDLE")
-                    failed_clusters.append(cluster_type)
-            except Exception as e:
-                _log(f"   ✗ {cluster_type} cluster error: {e}")
-                failed_clusters.append(cluster_type)
+
+@pytest.fixture(scope="session")
+def test_clusters(cluster_futures):
+    """
+    Session-scoped fixture that waits for the M0, M10, and Flex clusters.
+
+    This fixture:
+    1. Waits for all parallel cluster creations to reach IDLE state
+    2. Returns cluster info for tests to use
+    3. Does NOT delete clusters (project deletion handles that)
+    """
+    futures = cluster_futures["futures"]
+    created_clusters = {}
+    failed_clusters = []
+
+    _log("\n   Waiting for clusters to reach IDLE state...")
+    types_by_future = {future: cluster_type for cluster_type, future in futures.items()}
+    for future in as_completed(types_by_future):
+        cluster_type = types_by_future[future]
+        try:
+            created_clusters[cluster_type] = future.result()
+        except Exception:
+            # Already reported by the future's done-callback
+            failed_clusters.append(cluster_type)
 
     _log("\n" + "=" * 80)
     _log("Test Clusters Ready")
@@ -862,9 +1238,9 @@ def test_clusters(test_project, atlasui_server):
 
     # Return cluster info for tests
     yield {
-        "project_id": project_id,
-        "project_name": TEST_PROJECT_NAME,
-        "org_id": test_project["org_id"],
+        "project_id": cluster_futures["project_id"],
+        "project_name": cluster_futures["project_name"],
+        "org_id": cluster_futures["org_id"],
         "clusters": {
             "m0": created_clusters.get("M0", {}).get("name"),
             "m10": created_clusters.get("M10", {}).get("name"),
@@ -877,44 +1253,36 @@ def test_clusters(test_project, atlasui_server):
     _log("\n   Test clusters will be deleted with project cleanup")
 
 
-# Individual cluster fixtures for tests that only need one type
-@pytest.fixture(scope="session")
-def m0_cluster(test_clusters):
-    """Session-scoped fixture providing M0 cluster info."""
-    if "M0" in test_clusters.get("failed", []):
-        pytest.skip("M0 cluster creation failed")
-    if not test_clusters["clusters"]["m0"]:
-        pytest.skip("M0 cluster not available")
+def _single_cluster_info(cluster_futures: Dict[str, Any], cluster_type: str) -> Dict[str, Any]:
+    """Block on one cluster's future and return its info, skipping if it failed."""
+    try:
+        cluster = cluster_futures["futures"][cluster_type].result()
+    except Exception as e:
+        pytest.skip(f"{cluster_type} cluster creation failed: {e}")
+    if not cluster.get("name"):
+        pytest.skip(f"{cluster_type} cluster not available")
     return {
-        "project_id": test_clusters["project_id"],
-        "cluster_name": test_clusters["clusters"]["m0"],
-        "org_id": test_clusters["org_id"]
+        "project_id": cluster_futures["project_id"],
+        "cluster_name": cluster["name"],
+        "org_id": cluster_futures["org_id"]
     }
 
 
+# Individual cluster fixtures for tests that only need one type.
+# These wait only for their own cluster, not for all three.
 @pytest.fixture(scope="session")
-def m10_cluster(test_clusters):
+def m0_cluster(cluster_futures):
+    """Session-scoped fixture providing M0 cluster info."""
+    return _single_cluster_info(cluster_futures, "M0")
+
+
+@pytest.fixture(scope="session")
+def m10_cluster(cluster_futures):
     """Session-scoped fixture providing M10 cluster info."""
-    if "M10" in test_clusters.get("failed", []):
-        pytest.skip("M10 cluster creation failed")
-    if not test_clusters["clusters"]["m10"]:
-        pytest.skip("M10 cluster not available")
-    return {
-        "project_id": test_clusters["project_id"],
-        "cluster_name": test_clusters["clusters"]["m10"],
-        "org_id": test_clusters["org_id"]
-    }
+    return _single_cluster_info(cluster_futures, "M10")
 
 
 @pytest.fixture(scope="session")
-def flex_cluster(test_clusters):
+def flex_cluster(cluster_futures):
     """Session-scoped fixture providing Flex cluster info."""
-    if "Flex" in test_clusters.get("failed", []):
-        pytest.skip("Flex cluster creation failed")
-    if not test_clusters["clusters"]["flex"]:
-        pytest.skip("Flex cluster not available")
-    return {
-        "project_id": test_clusters["project_id"],
-        "cluster_name": test_clusters["clusters"]["flex"],
-        "org_id": test_clusters["org_id"]
-    }
+    return _single_cluster_info(cluster_futures, "Flex")
@@ -0,0 +1,191 @@
+"""
+Retry and polling helpers shared by the test harness (conftest.py), the
+cluster feature tests and the cleanup script.
+
+Transient connection-level failures (the AtlasUI server dropping a
+connection or a read timing out) are retried a few times with jittered
+exponential backoff. HTTP error responses are never retried here; callers
+decide what a 4xx or 5xx means, using retry_after_seconds() to honour a
+server's Retry-After hint. poll_cluster_state() waits for a cluster to
+settle using the same backoff and Retry-After handling.
+
+Nothing here needs Playwright, so the helpers are unit tested offline in
+test_http_retry.py.
+"""
+
+import functools
+import random
+import sys
+import time
+from typing import Any, Callable, Optional, TypeVar
+
+import httpx
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Connection-level errors worth retrying
+TRANSIENT_ERRORS = (httpx.ConnectError, httpx.ReadTimeout)
+
+# AtlasUI server started by the atlasui_server fixture
+DEFAULT_BASE_URL = "http://localhost:8100"
+
+# Transitional states that indicate the cluster is still changing
+TRANSITIONAL_STATES = ["CREATING", "UPDATING", "REPAIRING", "DELETING", "PAUSING", "RESUMING"]
+
+
+def _log(msg: str) -> None:
+    """Print message and flush immediately."""
+    print(msg, flush=True)
+    sys.stdout.flush()
+
+
+def retry_transient(attempts: int = 3, base_delay: float = 0.3) -> Callable[[F], F]:
+    """
+    Retry the decorated function on transient connection errors.
+
+    Args:
+        attempts: Total number of attempts (including the first call)
+        base_delay: Delay before the first retry in seconds; doubles on each
+            retry and is jittered by +/-50% so parallel callers do not retry
+            in lockstep
+
+    Returns:
+        Decorator that applies the retry policy
+    """
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            for attempt in range(attempts):
+                try:
+                    return func(*args, **kwargs)
+                except TRANSIENT_ERRORS:
+                    if attempt == attempts - 1:
+                        raise
+                    time.sleep(base_delay * (2 ** attempt) * random.uniform(0.5, 1.5))
+        return wrapper  # type: ignore[return-value]
+    return decorator
+
+
+def retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    """Parse a delta-seconds Retry-After header, or None if absent or not numeric."""
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def next_delay(attempt: int, base: float = 2.0, cap: float = 30.0) -> float:
+    """
+    Exponential poll delay for the given attempt number (0-based).
+
+    Args:
+        attempt: Number of polls already made
+        base: Delay after the first poll in seconds
+        cap: Upper bound on the delay in seconds
+
+    Returns:
+        base * 2**attempt, capped at cap
+    """
+    return min(cap, base * (2 ** attempt))
+
+
+def poll_cluster_state(
+    project_id: str,
+    cluster_name: str,
+    expected_paused: bool,
+    timeout: int = 900,
+    *,
+    base_url: str = DEFAULT_BASE_URL,
+    time_source: Callable[[], float] = time.time,
+    sleep: Callable[[float], None] = time.sleep,
+) -> dict:
+    """
+    Poll the cluster API until it reaches a stable state with the expected paused flag.
+
+    MongoDB Atlas clusters in a paused state show stateName: IDLE with paused: True.
+    Running clusters show stateName: IDLE with paused: False.
+    We wait for the cluster to exit transitional states (UPDATING, REPAIRING, etc.)
+    and reach IDLE with the expected paused flag.
+
+    Polls back off exponentially (2s, 4s, 8s ... capped at 30s), restarting
+    from 2s whenever the cluster changes state, and never sooner than a
+    Retry-After hint from the server. A failed poll (connection error or
+    non-200 response) keeps the last known state, leaves the backoff where
+    it was and retries after the base delay, so a brief backend blip costs
+    seconds rather than a full backoff interval.
+
+    Args:
+        project_id: The project ID
+        cluster_name: The cluster name
+        expected_paused: The expected paused flag (True for paused, False for running)
+        timeout: Maximum time to wait in seconds (default: 900 = 15 minutes)
+        base_url: AtlasUI server to poll
+        time_source: Clock returning seconds (injectable so unit tests skip real waits)
+        sleep: Sleep function used between polls (injectable for the same reason)
+
+    Returns:
+        The cluster data when state is reached
+
+    Raises:
+        TimeoutError: If the cluster doesn't reach the expected state within timeout
+    """
+    start_time = time_source()
+    attempt = 0  # polls since the cluster last changed state; drives the backoff
+    last_seen = None
+
+    while time_source() - start_time < timeout:
+        elapsed = int(time_source() - start_time)
+        retry_after = None
+        failed = False
+
+        try:
+            response = httpx.get(
+                f"{base_url}/api/clusters/{project_id}/{cluster_name}",
+                timeout=30.0,
+                follow_redirects=True
+            )
+            retry_after = retry_after_seconds(response)
+            if response.status_code != 200:
+                raise RuntimeError(f"HTTP {response.status_code}")
+
+            data = response.json()
+            state = data.get("stateName", "UNKNOWN")
+            paused = data.get("paused", False)
+
+            _log(f"   Cluster state: {state}, paused: {paused} ({elapsed}s elapsed)")
+            if (state, paused) != last_seen:
+                last_seen = (state, paused)
+                attempt = 0
+
+            # Check if cluster has reached stable state with expected paused flag
+            is_stable = state not in TRANSITIONAL_STATES
+            paused_match = (paused == expected_paused)
+
+            if is_stable and paused_match:
+                return data
+
+        except Exception as e:
+            # Stale fallback: keep waiting on the last state we saw
+            known = f"state: {last_seen[0]}, paused: {last_seen[1]}" if last_seen else "no state yet"
+            _log(f"   Poll error: {e}; last known {known} ({elapsed}s elapsed)")
+            failed = True
+
+        # A failed poll retries after the base delay without advancing the backoff
+        delay = next_delay(0 if failed else attempt)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        if not failed:
+            attempt += 1
+        sleep(delay)
+
+    # Timeout reached
+    elapsed = int(time_source() - start_time)
+    error_msg = (
+        f"Timeout after {elapsed}s waiting for cluster '{cluster_name}' "
+        f"to reach paused={expected_paused}"
+    )
+    _log(f"   ✗ {error_msg}")
+    raise TimeoutError(error_msg)
@@ -0,0 +1,248 @@
+"""
+Shared fixtures for AtlasUI unit and integration tests.
+
+Registered from conftest.py via ``pytest_plugins`` so that every test module
+gets the same credential check, Atlas client fixtures and sample API
+payloads from a single definition.
+"""
+
+import os
+import sys
+from types import MappingProxyType
+from typing import Any, Dict, Optional, Tuple
+
+import pytest
+import pytest_asyncio
+from unittest.mock import AsyncMock, patch
+from atlasui.client import AtlasClient
+from atlasui.config import settings
+
+
+@pytest.fixture(scope="session")
+def validate_credentials():
+    """
+    Validate that Atlas API credentials are configured and working.
+
+    This fixture runs once per test session and validates that:
+    1. API credentials are configured in environment
+    2. The credentials are valid and can authenticate to Atlas API
+
+    If validation fails, integration tests will be skipped.
+
+    Returns:
+        bool: True if credentials are valid, False otherwise
+    """
+    try:
+        # Check if credentials are configured
+        if settings.atlas_auth_method == "api_key":
+            if not settings.atlas_public_key or not settings.atlas_private_key:
+                print("\n⚠️  Atlas API keys not configured. Skipping integration tests.", file=sys.stderr)
+                print("   Set ATLAS_PUBLIC_KEY and ATLAS_PRIVATE_KEY environment variables.", file=sys.stderr)
+                return False
+        elif settings.atlas_auth_method == "service_account":
+            if not settings.atlas_service_account_credentials_file:
+                if not settings.atlas_service_account_id or not settings.atlas_service_account_secret:
+                    print("\n⚠️  Atlas service account credentials not configured. Skipping integration tests.", file=sys.stderr)
+                    return False
+
+        # Credentials are configured - integration tests can run
+        print("\n✓ Atlas credentials configured - integration tests enabled", file=sys.stderr)
+        return True
+
+    except Exception as e:
+        print(f"\n⚠️  Failed to validate Atlas credentials: {e}", file=sys.stderr)
+        return False
+
+
+# Listing cache for the shared integration client; AtlasClient itself
+# does not cache unless asked to
+TEST_LIST_CACHE_TTL = 5.0
+
+
+class CachingAtlasClient(AtlasClient):
+    """
+    AtlasClient that answers repeated GETs from memory.
+
+    Successful GET responses are kept for the life of the client, keyed by
+    endpoint and query parameters; any other method clears them first.
+    Used by the atlas_client fixture when ATLAS_TEST_CACHE=1.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._get_cache: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], Dict[str, Any]] = {}
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        if method != "GET":
+            self._get_cache.clear()
+            return await super()._request(method, endpoint, params=params, json=json)
+
+        key = (endpoint, tuple(sorted((params or {}).items())))
+        if key not in self._get_cache:
+            self._get_cache[key] = await super()._request(method, endpoint, params=params)
+        return self._get_cache[key]
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def atlas_client(validate_credentials):
+    """
+    Create a real Atlas API client for integration tests.
+
+    Requires valid credentials to be configured.
+    Skips test if credentials are not valid.
+
+    Note: This fixture uses session scope so every integration test shares one
+    client and its keep-alive connection pool. Tests using it must run on the
+    session event loop (``@pytest.mark.asyncio(loop_scope="session")``).
+    Async integration tests should be run separately from browser tests to avoid
+    event loop conflicts.
+
+    Project and cluster listings are reused for TEST_LIST_CACHE_TTL seconds.
+    Set ATLAS_TEST_CACHE=1 to reuse every GET response for the whole session
+    (CachingAtlasClient); that is off by default so that API latency
+    regressions still show up in the test timings.
+    """
+    if not validate_credentials:
+        pytest.skip("Atlas API credentials not configured or invalid")
+
+    client_class = CachingAtlasClient if os.environ.get("ATLAS_TEST_CACHE") == "1" else AtlasClient
+    async with client_class(cache_ttl=TEST_LIST_CACHE_TTL) as client:
+        yield client
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def all_organizations(atlas_client):
+    """The first page of list_organizations(), fetched once per session."""
+    return await atlas_client.list_organizations()
+
+
+@pytest.fixture(scope="session")
+def first_org_id(all_organizations):
+    """ID of the first organization; skips if the account has none."""
+    if not all_organizations["results"]:
+        pytest.skip("No organizations available for testing")
+    return all_organizations["results"][0]["id"]
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def all_projects(atlas_client):
+    """The first page of list_projects(), fetched once per session."""
+    return await atlas_client.list_projects()
+
+
+@pytest.fixture(scope="session")
+def first_project_id(all_projects):
+    """ID of the first project; skips if the account has none."""
+    if not all_projects["results"]:
+        pytest.skip("No projects available for testing")
+    return all_projects["results"][0]["id"]
+
+
+@pytest.fixture
+def mock_atlas_client():
+    """Create a mock Atlas client for unit testing."""
+    with patch('atlasui.client.base.httpx.AsyncClient') as mock_client:
+        # Configure the mock to return AsyncMock for async methods
+        mock_instance = AsyncMock()
+        mock_client.return_value = mock_instance
+        yield mock_client
+
+
+@pytest.fixture
+def patched_atlas_client(mock_atlas_client):
+    """
+    Create an API-key AtlasClient on top of the mocked httpx.AsyncClient.
+
+    Set ``patched_atlas_client.client.request`` to control the responses.
+    """
+    return AtlasClient(public_key="test", private_key="test")
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively make sample data read-only (dicts -> mapping proxies, lists -> tuples)."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """
+    Return a plain, mutable copy of frozen sample data.
+
+    Use when the data must look exactly like decoded JSON, e.g. when a
+    mocked AtlasClient returns it through a FastAPI endpoint.
+    """
+    if isinstance(value, MappingProxyType):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    return value
+
+
+# Sample Atlas API payloads, built once and frozen so session-scoped
+# fixtures can hand out the same objects to every test. Tests that need
+# a variation should build a new dict, e.g. {**sample_project, "name": ...}.
+SAMPLE_PROJECT = _freeze({
+    "id": "5a0a1e7e0f2912c554080adc",
+    "name": "Test Project",
+    "orgId": "5a0a1e7e0f2912c554080abc",
+    "created": "2023-01-01T00:00:00Z",
+    "clusterCount": 2
+})
+
+SAMPLE_CLUSTER = _freeze({
+    "name": "test-cluster",
+    "stateName": "IDLE",
+    "mongoDBVersion": "7.0.0",
+    "clusterType": "REPLICASET",
+    "providerSettings": {
+        "providerName": "AWS",
+        "regionName": "US_EAST_1",
+        "instanceSizeName": "M10"
+    },
+    "connectionStrings": {
+        "standard": "mongodb://test-cluster.mongodb.net:27017"
+    }
+})
+
+SAMPLE_PROJECTS_RESPONSE = MappingProxyType({
+    "results": (SAMPLE_PROJECT,),
+    "totalCount": 1
+})
+
+SAMPLE_CLUSTERS_RESPONSE = MappingProxyType({
+    "results": (SAMPLE_CLUSTER,),
+    "totalCount": 1
+})
+
+
+@pytest.fixture(scope="session")
+def sample_project():
+    """Sample project data for testing (read-only)."""
+    return SAMPLE_PROJECT
+
+
+@pytest.fixture(scope="session")
+def sample_cluster():
+    """Sample cluster data for testing (read-only)."""
+    return SAMPLE_CLUSTER
+
+
+@pytest.fixture(scope="session")
+def sample_projects_response():
+    """Sample projects list response (read-only)."""
+    return SAMPLE_PROJECTS_RESPONSE
+
+
+@pytest.fixture(scope="session")
+def sample_clusters_response():
+    """Sample clusters list response (read-only)."""
+    return SAMPLE_CLUSTERS_RESPONSE
@@ -7,6 +7,7 @@ from fastapi.testclient import TestClient
 from unittest.mock import patch, Mock, AsyncMock
 
 from atlasui.server import app
+from tests.shared_fixtures import thaw
 
 client = TestClient(app)
 
@@ -20,6 +21,13 @@ def test_health_check():
     assert "version" in data
 
 
+def test_health_check_head():
+    """Test health check endpoint answers HEAD requests."""
+    response = client.head("/health")
+    assert response.status_code == 200
+    assert response.content == b""
+
+
 def test_root_redirect():
     """Test root endpoint redirects."""
     response = client.get("/", follow_redirects=False)
@@ -33,7 +41,7 @@ def test_root_redirect():
 def test_list_projects_api(mock_client_class, sample_projects_response):
     """Test list projects API endpoint."""
     mock_client = AsyncMock()
-    mock_client.list_projects.return_value = sample_projects_response
+    mock_client.list_projects.return_value = thaw(sample_projects_response)
     mock_client_class.return_value.__aenter__.return_value = mock_client
 
     response = client.get("/api/projects/")
@@ -43,11 +51,31 @@ def test_list_projects_api(mock_client_class, sample_projects_response):
     assert len(data["results"]) == 1
 
 
+@patch('atlasui.api.projects.AtlasClient')
+def test_list_projects_api_name_prefix(mock_client_class, sample_project):
+    """Test list projects API filters the page by name prefix and keeps the Atlas total."""
+    sample_project = thaw(sample_project)
+    other_project = {**sample_project, "id": "5a0a1e7e0f2912c554080add", "name": "Other Project"}
+    mock_client = AsyncMock()
+    mock_client.list_projects.return_value = {
+        "results": [sample_project, other_project],
+        "totalCount": 2
+    }
+    mock_client_class.return_value.__aenter__.return_value = mock_client
+
+    response = client.get("/api/projects/", params={"name_prefix": "Test"})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["totalCount"] == 2
+    assert data["filteredCount"] == 1
+    assert [p["name"] for p in data["results"]] == ["Test Project"]
+
+
 @patch('atlasui.api.projects.AtlasClient')
 def test_get_project_api(mock_client_class, sample_project):
     """Test get project API endpoint."""
     mock_client = AsyncMock()
-    mock_client.get_project.return_value = sample_project
+    mock_client.get_project.return_value = thaw(sample_project)
     mock_client_class.return_value.__aenter__.return_value = mock_client
 
     project_id = "5a0a1e7e0f2912c554080adc"
@@ -61,7 +89,7 @@ def test_get_project_api(mock_client_class, sample_project):
 def test_list_clusters_api(mock_client_class, sample_clusters_response):
     """Test list clusters API endpoint."""
     mock_client = AsyncMock()
-    mock_client.list_clusters.return_value = sample_clusters_response
+    mock_client.list_clusters.return_value = thaw(sample_clusters_response)
     mock_client_class.return_value.__aenter__.return_value = mock_client
 
     project_id = "5a0a1e7e0f2912c554080adc"
@@ -76,7 +104,7 @@ def test_list_clusters_api(mock_client_class, sample_clusters_response):
 def test_get_cluster_api(mock_client_class, sample_cluster):
     """Test get cluster API endpoint."""
     mock_client = AsyncMock()
-    mock_client.get_cluster.return_value = sample_cluster
+    mock_client.get_cluster.return_value = thaw(sample_cluster)
     mock_client_class.return_value.__aenter__.return_value = mock_client
 
     project_id = "5a0a1e7e0f2912c554080adc"
@@ -86,3 +114,66 @@ def test_get_cluster_api(mock_client_class, sample_cluster):
     data = response.json()
     assert data["name"] == "test-cluster"
     assert data["stateName"] == "IDLE"
+
+
+@patch('atlasui.api.clusters.AtlasClient')
+def test_get_cluster_named_events(mock_client_class, sample_cluster):
+    """Test a cluster named 'events' is served by get cluster, not the event stream."""
+    mock_client = AsyncMock()
+    mock_client.get_cluster.return_value = {**thaw(sample_cluster), "name": "events"}
+    mock_client_class.return_value.__aenter__.return_value = mock_client
+
+    response = client.get("/api/clusters/5a0a1e7e0f2912c554080adc/events")
+    assert response.status_code == 200
+    assert response.json()["name"] == "events"
+    assert "etag" in response.headers
+    mock_client.get_cluster.assert_awaited_once_with("5a0a1e7e0f2912c554080adc", "events")
+
+
+@patch('atlasui.api.clusters.AtlasClient')
+def test_get_cluster_api_not_modified(mock_client_class, sample_cluster):
+    """Test get cluster API returns 304 when the ETag matches."""
+    mock_client = AsyncMock()
+    mock_client.get_cluster.return_value = thaw(sample_cluster)
+    mock_client_class.return_value.__aenter__.return_value = mock_client
+
+    url = "/api/clusters/5a0a1e7e0f2912c554080adc/test-cluster"
+    response = client.get(url)
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+@patch('atlasui.api.clusters._events_poll_interval', 0)
+@patch('atlasui.api.clusters.AtlasClient')
+def test_stream_cluster_events_until_idle(mock_client_class, sample_cluster):
+    """Test cluster event stream reports changes and ends once all clusters are IDLE."""
+    sample_cluster = thaw(sample_cluster)
+    creating = {**sample_cluster, "stateName": "CREATING"}
+    mock_client = AsyncMock()
+    mock_client.list_clusters.side_effect = [
+        {"results": [creating], "totalCount": 1},
+        {"results": [creating], "totalCount": 1},
+        {"results": [sample_cluster], "totalCount": 1},
+    ]
+    mock_client.list_flex_clusters.return_value = {"results": [], "totalCount": 0}
+    mock_client_class.return_value.__aenter__.return_value = mock_client
+
+    url = "/api/clusters/events/5a0a1e7e0f2912c554080adc?until_idle=true"
+    with client.stream("GET", url) as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        lines = [line for line in response.iter_lines() if line]
+
+    assert lines == [
+        "event: init",
+        'data: {"name": "test-cluster", "stateName": "CREATING", "paused": false, "type": "regular"}',
+        ": keepalive",
+        "event: state",
+        'data: {"name": "test-cluster", "stateName": "IDLE", "paused": false, "type": "regular"}',
+        "event: idle",
+        "data: {}",
+    ]
@@ -20,6 +20,20 @@ def test_atlas_client_initialization():
         assert client.base_url == "https://test.mongodb.com/api/atlas/v2"
 
 
+def test_atlas_client_connection_pool_settings():
+    """Test the HTTP client is built with the configured pool and HTTP/2 settings."""
+    from atlasui.client.base import HTTP2_AVAILABLE
+    from atlasui.config import settings
+
+    with patch('atlasui.client.base.httpx.AsyncClient') as mock_client:
+        AtlasClient(public_key="test", private_key="test")
+
+    kwargs = mock_client.call_args.kwargs
+    assert kwargs["limits"].max_connections == settings.http_max_connections
+    assert kwargs["limits"].max_keepalive_connections == settings.http_max_keepalive
+    assert kwargs["http2"] == (settings.http2 and HTTP2_AVAILABLE)
+
+
 @pytest.mark.asyncio
 async def test_atlas_client_context_manager():
     """Test Atlas client works as async context manager."""
@@ -33,82 +47,151 @@ async def test_atlas_client_context_manager():
 
 
 @pytest.mark.asyncio
-async def test_get_root(mock_atlas_client):
+async def test_get_root(patched_atlas_client):
     """Test getting API root."""
     mock_response = Mock()
     mock_response.status_code = 200
     mock_response.json.return_value = {"appName": "MongoDB Atlas"}
 
     # Configure the async request method
-    mock_atlas_client.return_value.request = AsyncMock(return_value=mock_response)
+    patched_atlas_client.client.request = AsyncMock(return_value=mock_response)
 
-    async with AtlasClient(public_key="test", private_key="test") as client:
-        result = await client.get_root()
-        assert result["appName"] == "MongoDB Atlas"
+    result = await patched_atlas_client.get_root()
+    assert result["appName"] == "MongoDB Atlas"
 
 
 @pytest.mark.asyncio
-async def test_list_projects(mock_atlas_client, sample_projects_response):
+async def test_list_projects(patched_atlas_client, sample_projects_response):
     """Test listing projects."""
     mock_response = Mock()
     mock_response.status_code = 200
     mock_response.json.return_value = sample_projects_response
 
     # Configure the async request method
-    mock_atlas_client.return_value.request = AsyncMock(return_value=mock_response)
+    patched_atlas_client.client.request = AsyncMock(return_value=mock_response)
 
-    async with AtlasClient(public_key="test", private_key="test") as client:
-        result = await client.list_projects()
-        assert result["totalCount"] == 1
-        assert len(result["results"]) == 1
-        assert result["results"][0]["name"] == "Test Project"
+    result = await patched_atlas_client.list_projects()
+    assert result["totalCount"] == 1
+    assert len(result["results"]) == 1
+    assert result["results"][0]["name"] == "Test Project"
 
 
 @pytest.mark.asyncio
-async def test_get_project(mock_atlas_client, sample_project):
+async def test_get_project(patched_atlas_client, sample_project):
     """Test getting a specific project."""
     mock_response = Mock()
     mock_response.status_code = 200
     mock_response.json.return_value = sample_project
 
     # Configure the async request method
-    mock_atlas_client.return_value.request = AsyncMock(return_value=mock_response)
+    patched_atlas_client.client.request = AsyncMock(return_value=mock_response)
 
-    async with AtlasClient(public_key="test", private_key="test") as client:
-        result = await client.get_project("5a0a1e7e0f2912c554080adc")
-        assert result["name"] == "Test Project"
-        assert result["id"] == "5a0a1e7e0f2912c554080adc"
+    result = await patched_atlas_client.get_project("5a0a1e7e0f2912c554080adc")
+    assert result["name"] == "Test Project"
+    assert result["id"] == "5a0a1e7e0f2912c554080adc"
 
 
 @pytest.mark.asyncio
-async def test_list_clusters(mock_atlas_client, sample_clusters_response):
+async def test_list_clusters(patched_atlas_client, sample_clusters_response):
     """Test listing clusters."""
     mock_response = Mock()
     mock_response.status_code = 200
     mock_response.json.return_value = sample_clusters_response
 
     # Configure the async request method
-    mock_atlas_client.return_value.request = AsyncMock(return_value=mock_response)
+    patched_atlas_client.client.request = AsyncMock(return_value=mock_response)
+
+    result = await patched_atlas_client.list_clusters("5a0a1e7e0f2912c554080adc")
+    assert result["totalCount"] == 1
+    assert len(result["results"]) == 1
+    assert result["results"][0]["name"] == "test-cluster"
+
+
+@pytest.mark.asyncio
+async def test_listings_not_cached_by_default(patched_atlas_client, sample_clusters_response):
+    """Test a default client fetches every listing so pollers always see current state."""
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = sample_clusters_response
+    patched_atlas_client.client.request = AsyncMock(return_value=mock_response)
+
+    await patched_atlas_client.list_clusters("5a0a1e7e0f2912c554080adc")
+    await patched_atlas_client.list_clusters("5a0a1e7e0f2912c554080adc")
+    assert patched_atlas_client.client.request.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_list_clusters_cached_until_mutation(patched_atlas_client, sample_clusters_response):
+    """Test cluster listings are reused until a cluster mutation invalidates them."""
+    patched_atlas_client.cache_ttl = 5.0
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = sample_clusters_response
+
+    # Configure the async request method
+    patched_atlas_client.client.request = AsyncMock(return_value=mock_response)
+    request = patched_atlas_client.client.request
+
+    await patched_atlas_client.list_clusters("5a0a1e7e0f2912c554080adc")
+    await patched_atlas_client.list_clusters("5a0a1e7e0f2912c554080adc")
+    assert request.await_count == 1
+
+    await patched_atlas_client.pause_cluster("5a0a1e7e0f2912c554080adc", "test-cluster")
+    await patched_atlas_client.list_clusters("5a0a1e7e0f2912c554080adc")
+    assert request.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_cached_listing_is_not_shared_with_callers(patched_atlas_client):
+    """Test mutating a cached listing does not change what later calls receive."""
+    patched_atlas_client.cache_ttl = 5.0
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = {"results": [{"name": "a"}, {"name": "b"}], "totalCount": 2}
+    patched_atlas_client.client.request = AsyncMock(return_value=mock_response)
+
+    first = await patched_atlas_client.list_projects()
+    first["results"] = first["results"][:1]
+    first["totalCount"] = 1
+
+    second = await patched_atlas_client.list_projects()
+    assert second["totalCount"] == 2
+    assert len(second["results"]) == 2
+    assert patched_atlas_client.client.request.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_caching_client_reuses_gets_until_mutation(mock_atlas_client, sample_cluster):
+    """Test the integration-test caching client serves repeated GETs from memory."""
+    from tests.shared_fixtures import CachingAtlasClient
+
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = sample_cluster
+
+    client = CachingAtlasClient(public_key="test", private_key="test")
+    client.client.request = AsyncMock(return_value=mock_response)
+
+    await client.get_cluster("5a0a1e7e0f2912c554080adc", "test-cluster")
+    await client.get_cluster("5a0a1e7e0f2912c554080adc", "test-cluster")
+    assert client.client.request.await_count == 1
 
-    async with AtlasClient(public_key="test", private_key="test") as client:
-        result = await client.list_clusters("5a0a1e7e0f2912c554080adc")
-        assert result["totalCount"] == 1
-        assert len(result["results"]) == 1
-        assert result["results"][0]["name"] == "test-cluster"
+    await client.pause_cluster("5a0a1e7e0f2912c554080adc", "test-cluster")
+    await client.get_cluster("5a0a1e7e0f2912c554080adc", "test-cluster")
+    assert client.client.request.await_count == 3
 
 
 @pytest.mark.asyncio
-async def test_get_cluster(mock_atlas_client, sample_cluster):
+async def test_get_cluster(patched_atlas_client, sample_cluster):
     """Test getting a specific cluster."""
     mock_response = Mock()
     mock_response.status_code = 200
     mock_response.json.return_value = sample_cluster
 
     # Configure the async request method
-    mock_atlas_client.return_value.request = AsyncMock(return_value=mock_response)
+    patched_atlas_client.client.request = AsyncMock(return_value=mock_response)
 
-    async with AtlasClient(public_key="test", private_key="test") as client:
-        result = await client.get_cluster("5a0a1e7e0f2912c554080adc", "test-cluster")
-        assert result["name"] == "test-cluster"
-        assert result["stateName"] == "IDLE"
-        assert result["mongoDBVersion"] == "7.0.0"
+    result = await patched_atlas_client.get_cluster("5a0a1e7e0f2912c554080adc", "test-cluster")
+    assert result["name"] == "test-cluster"
+    assert result["stateName"] == "IDLE"
+    assert result["mongoDBVersion"] == "7.0.0"
@@ -29,9 +29,8 @@ Usage:
 import pytest
 import re
 import sys
-import time
-import httpx
-from playwright.sync_api import Page
+from playwright.sync_api import Page, expect
+from tests.http_retry import TRANSITIONAL_STATES, poll_cluster_state
 
 
 def log(msg: str) -> None:
@@ -43,69 +42,90 @@ def log(msg: str) -> None:
 # Test configuration
 BASE_URL = "http://localhost:8100"
 
+# Status column is td:nth-child(3): Name | Project | Status | Type | ...
+_STATUS_SNAPSHOT_JS = """
+() => Object.fromEntries(
+    [...document.querySelectorAll('tr[data-cluster-name]')].map(row => {
+        const badge = row.querySelector('td:nth-child(3) .badge');
+        return [row.dataset.clusterName, badge ? badge.textContent.trim() : null];
+    })
+)
+"""
+
 
-def poll_cluster_state(project_id: str, cluster_name: str, expected_paused: bool, timeout: int = 900) -> dict:
+def cluster_status_snapshot(page: Page) -> dict:
     """
-    Poll the cluster API until it reaches a stable state with the expected paused flag.
+    Read every cluster row's status badge in one browser round-trip.
+
+    Returns:
+        Mapping of cluster name to badge text (None if the row has no badge)
+    """
+    return page.evaluate(_STATUS_SNAPSHOT_JS)
+
+
+# Resolves with the first init/state event showing the cluster settled with the
+# expected paused flag, {unavailable: true} if the stream cannot be opened, or
+# null on timeout
+_WAIT_FOR_STATE_JS = """
+([url, name, expectedPaused, transitional, timeoutMs]) => new Promise(resolve => {
+    const source = new EventSource(url);
+    let opened = false;
+    const finish = result => { clearTimeout(timer); source.close(); resolve(result); };
+    const timer = setTimeout(() => finish(null), timeoutMs);
+    const check = event => {
+        opened = true;
+        const state = JSON.parse(event.data);
+        if (state.name === name && state.paused === expectedPaused &&
+                !transitional.includes(state.stateName)) {
+            finish(state);
+        }
+    };
+    source.addEventListener('init', check);
+    source.addEventListener('state', check);
+    source.onerror = () => { if (!opened) finish({unavailable: true}); };
+})
+"""
 
-    MongoDB Atlas clusters in a paused state show stateName: IDLE with paused: True.
-    Running clusters show stateName: IDLE with paused: False.
-    We wait for the cluster to exit transitional states (UPDATING, REPAIRING, etc.)
-    and reach IDLE with the expected paused flag.
+
+def wait_for_cluster_state(page: Page, project_id: str, cluster_name: str,
+                           expected_paused: bool, timeout: int = 900) -> dict:
+    """
+    Wait in the browser for the cluster events stream to report the expected state.
+
+    Subscribes once to /api/clusters/events/{project_id} instead of polling,
+    so the page never has to reload. Falls back to poll_cluster_state if
+    the stream cannot be opened.
 
     Args:
+        page: Playwright page on the AtlasUI origin
         project_id: The project ID
         cluster_name: The cluster name
         expected_paused: The expected paused flag (True for paused, False for running)
         timeout: Maximum time to wait in seconds (default: 900 = 15 minutes)
 
     Returns:
-        The cluster data when state is reached
+        The cluster state from the event stream
 
     Raises:
         TimeoutError: If the cluster doesn't reach the expected state within timeout
     """
-    start_time = time.time()
-    poll_interval = 5  # seconds
-    # Transitional states that indicate the cluster is still changing
-    transitional_states = ["CREATING", "UPDATING", "REPAIRING", "DELETING", "PAUSING", "RESUMING"]
-
-    while time.time() - start_time < timeout:
-        elapsed = int(time.time() - start_time)
-
-        try:
-            response = httpx.get(
-                f"{BASE_URL}/api/clusters/{project_id}/{cluster_name}",
-                timeout=30.0,
-                follow_redirects=True
-            )
-            if response.status_code == 200:
-                data = response.json()
-                state = data.get("stateName", "UNKNOWN")
-                paused = data.get("paused", False)
-
-                log(f"   Cluster state: {state}, paused: {paused} ({elapsed}s elapsed)")
-
-                # Check if cluster has reached stable state with expected paused flag
-                is_stable = state not in transitional_states
-                paused_match = (paused == expected_paused)
-
-                if is_stable and paused_match:
-                    return data
-
-        except Exception as e:
-            log(f"   Poll error: {e} ({elapsed}s elapsed)")
-
-        time.sleep(poll_interval)
-
-    # Timeout reached
-    elapsed = int(time.time() - start_time)
-    error_msg = (
-        f"Timeout after {elapsed}s waiting for cluster '{cluster_name}' "
-        f"to reach paused={expected_paused}"
+    state = page.evaluate(
+        _WAIT_FOR_STATE_JS,
+        [f"/api/clusters/events/{project_id}", cluster_name, expected_paused,
+         TRANSITIONAL_STATES, timeout * 1000],
     )
-    log(f"   ✗ {error_msg}")
-    raise TimeoutError(error_msg)
+    if state is None:
+        raise TimeoutError(
+            f"Timeout after {timeout}s waiting for cluster '{cluster_name}' "
+            f"to reach paused={expected_paused}"
+        )
+    if state.get("unavailable"):
+        log("   Event stream unavailable, polling the API instead")
+        return poll_cluster_state(
+            project_id, cluster_name, expected_paused, timeout, base_url=BASE_URL
+        )
+    log(f"   Cluster state: {state['stateName']}, paused: {state['paused']}")
+    return state
 
 
 # =============================================================================
@@ -123,8 +143,8 @@ def test_pause_resume_m10(page: Page, atlasui_server, m10_cluster):
     This test:
     1. Navigates to clusters page
     2. Verifies Pause button exists for M10 cluster
-    3. Clicks Pause and polls API for PAUSED state
-    4. Clicks Resume and polls API for IDLE state
+    3. Clicks Pause and waits on the cluster events stream for PAUSED state
+    4. Clicks Resume and waits on the cluster events stream for IDLE state
     5. Verifies countdown timer format (MM:SS + "Until next pause")
 
     The cluster is NOT deleted after the test - cleanup happens at session end.
@@ -157,17 +177,12 @@ def test_pause_resume_m10(page: Page, atlasui_server, m10_cluster):
     log("\n3. Clicking Pause button")
     pause_button.click()
 
-    # Poll API for paused state (not UI timeout)
-    log("4. Polling API for cluster to reach paused state...")
-    poll_cluster_state(project_id, cluster_name, expected_paused=True)
+    # Wait on the cluster events stream for paused state (not UI timeout)
+    log("4. Waiting for cluster to reach paused state...")
+    wait_for_cluster_state(page, project_id, cluster_name, expected_paused=True)
     log("   ✓ Cluster reached paused state (IDLE with paused=True)")
 
-    # Refresh page to ensure UI is in sync
-    page.reload()
-    page.wait_for_load_state("domcontentloaded")
-    page.wait_for_selector("#clustersContainer tr", timeout=30000)
-
-    # Verify UI shows Resume button
+    # Verify UI shows Resume button (the page updates the row itself once it sees the pause)
     resume_button_selector = f'button[data-pause-cluster="{cluster_name}"][data-pause-project="{project_id}"]:has-text("Resume")'
     page.wait_for_selector(resume_button_selector, timeout=30000)
     log("   Resume button visible in UI")
@@ -177,7 +192,7 @@ def test_pause_resume_m10(page: Page, atlasui_server, m10_cluster):
     # Look for PAUSED badge specifically since paused clusters show both IDLE and PAUSED
     # Status column is td:nth-child(3): Name | Project | Status | Type | ...
     paused_badge = cluster_row.locator("td:nth-child(3) .badge:has-text('PAUSED')")
-    assert paused_badge.count() > 0, f"Expected PAUSED badge for cluster {cluster_name}"
+    expect(paused_badge.first).to_be_visible(timeout=30000)
     log(f"   Status badge: PAUSED verified")
 
     # Step 4: Click Resume
@@ -185,16 +200,11 @@ def test_pause_resume_m10(page: Page, atlasui_server, m10_cluster):
     resume_button = page.locator(resume_button_selector)
     resume_button.click()
 
-    # Poll API for running state (not UI timeout)
-    log("6. Polling API for cluster to reach running state...")
-    poll_cluster_state(project_id, cluster_name, expected_paused=False)
+    # Wait on the cluster events stream for running state (not UI timeout)
+    log("6. Waiting for cluster to reach running state...")
+    wait_for_cluster_state(page, project_id, cluster_name, expected_paused=False)
     log("   ✓ Cluster reached running state (IDLE with paused=False)")
 
-    # Refresh page to ensure UI is in sync
-    page.reload()
-    page.wait_for_load_state("domcontentloaded")
-    page.wait_for_selector("#clustersContainer tr", timeout=30000)
-
     # Check for countdown timer
     log("7. Checking for countdown timer...")
     countdown_selector = f'button.pause-countdown[data-pause-cluster="{cluster_name}"][data-pause-project="{project_id}"]'
@@ -227,12 +237,11 @@ def test_pause_resume_m10(page: Page, atlasui_server, m10_cluster):
         # Verify countdown is ticking
         log("\n8. Verifying countdown is ticking...")
         initial_text = countdown_button.text_content()
-        page.wait_for_timeout(2000)
-        updated_text = countdown_button.text_content()
-
-        if initial_text != updated_text:
-            log(f"   Countdown ticking: {initial_text} -> {updated_text}")
-        else:
+        try:
+            # Auto-waits, so this returns on the first tick rather than after a fixed pause
+            expect(countdown_button).not_to_have_text(initial_text, timeout=5000)
+            log(f"   Countdown ticking: {initial_text} -> {countdown_button.text_content()}")
+        except AssertionError:
             log(f"   Countdown at: {initial_text}")
 
     except Exception as e:
@@ -256,63 +265,30 @@ def test_pause_resume_m10(page: Page, atlasui_server, m10_cluster):
 @pytest.mark.browser
 @pytest.mark.integration
 @pytest.mark.restrictions
-@pytest.mark.m0
-def test_m0_no_pause_button(page: Page, atlasui_server, m0_cluster):
-    """
-    Verify that M0 (Free Tier) clusters do not have a pause button.
-
-    M0 clusters cannot be paused because they use shared infrastructure.
-    """
-    project_id = m0_cluster["project_id"]
-    cluster_name = m0_cluster["cluster_name"]
-
-    log("\n" + "=" * 80)
-    log("TEST: Verify M0 cluster has no Pause button")
-    log("=" * 80)
-    log(f"   Project ID: {project_id}")
-    log(f"   Cluster: {cluster_name}")
-
-    log(f"\n1. Navigating to {BASE_URL}/clusters")
-    page.goto(f"{BASE_URL}/clusters")
-    page.wait_for_load_state("domcontentloaded")
-
-    log("2. Waiting for clusters to load")
-    page.wait_for_selector("#clustersContainer tr", timeout=30000)
-
-    log(f"3. Checking M0 cluster: {cluster_name}")
-    cluster_row = page.locator(f'tr[data-cluster-name="{cluster_name}"]')
-    assert cluster_row.count() > 0, f"Cluster {cluster_name} not found in UI"
-
-    # Verify no pause button exists
-    pause_button = cluster_row.locator("button:has-text('Pause')")
-    assert pause_button.count() == 0, \
-        f"M0 cluster {cluster_name} should not have a Pause button"
-
-    log(f"   Verified: No Pause button for M0 cluster")
-
-    log("\n" + "=" * 80)
-    log("TEST PASSED: M0 cluster correctly has no Pause button")
-    log("=" * 80)
-
-
-@pytest.mark.browser
-@pytest.mark.integration
-@pytest.mark.restrictions
-@pytest.mark.flex
-def test_flex_no_pause_button(page: Page, atlasui_server, flex_cluster):
+@pytest.mark.parametrize("cluster_fixture, label, reason", [
+    pytest.param("m0_cluster", "M0", "they use shared infrastructure",
+                 id="m0", marks=pytest.mark.m0),
+    pytest.param("flex_cluster", "Flex", "they use managed infrastructure",
+                 id="flex", marks=pytest.mark.flex),
+])
+def test_no_pause_button(page: Page, atlasui_server, request, cluster_fixture, label, reason):
     """
-    Verify that Flex clusters do not have a pause button.
+    Verify that M0 (Free Tier) and Flex clusters do not have a pause button.
 
-    Flex clusters cannot be paused because they use managed infrastructure.
+    Neither can be paused: M0 clusters use shared infrastructure and Flex
+    clusters use managed infrastructure. Both cases share one test body and
+    the session's browser setup.
     """
-    project_id = flex_cluster["project_id"]
-    cluster_name = flex_cluster["cluster_name"]
+    cluster = request.getfixturevalue(cluster_fixture)
+    project_id = cluster["project_id"]
+    cluster_name = cluster["cluster_name"]
 
     log("\n" + "=" * 80)
-    log("TEST: Verify Flex cluster has no Pause button")
+    log(f"TEST: Verify {label} cluster has no Pause button")
     log("=" * 80)
     log(f"   Project ID: {project_id}")
     log(f"   Cluster: {cluster_name}")
+    log(f"   ({label} clusters cannot be paused because {reason})")
 
     log(f"\n1. Navigating to {BASE_URL}/clusters")
     page.goto(f"{BASE_URL}/clusters")
@@ -321,19 +297,19 @@ def test_flex_no_pause_button(page: Page, atlasui_server, flex_cluster):
     log("2. Waiting for clusters to load")
     page.wait_for_selector("#clustersContainer tr", timeout=30000)
 
-    log(f"3. Checking Flex cluster: {cluster_name}")
+    log(f"3. Checking {label} cluster: {cluster_name}")
     cluster_row = page.locator(f'tr[data-cluster-name="{cluster_name}"]')
     assert cluster_row.count() > 0, f"Cluster {cluster_name} not found in UI"
 
     # Verify no pause button exists
     pause_button = cluster_row.locator("button:has-text('Pause')")
     assert pause_button.count() == 0, \
-        f"Flex cluster {cluster_name} should not have a Pause button"
+        f"{label} cluster {cluster_name} should not have a Pause button"
 
-    log(f"   Verified: No Pause button for Flex cluster")
+    log(f"   Verified: No Pause button for {label} cluster")
 
     log("\n" + "=" * 80)
-    log("TEST PASSED: Flex cluster correctly has no Pause button")
+    log(f"TEST PASSED: {label} cluster correctly has no Pause button")
     log("=" * 80)
 
 
@@ -421,17 +397,15 @@ def test_cluster_status_badges(page: Page, atlasui_server, test_clusters):
     page.wait_for_selector("#clustersContainer tr", timeout=30000)
 
     log("3. Checking status badges:")
+    badges = cluster_status_snapshot(page)
 
     for cluster_type, cluster_name in clusters.items():
         if not cluster_name or cluster_type.upper() in [f.upper() for f in failed]:
             log(f"   {cluster_type.upper()} - skipped (creation failed)")
             continue
 
-        cluster_row = page.locator(f'tr[data-cluster-name="{cluster_name}"]').first
-        if cluster_row.count() > 0:
-            # Status column is td:nth-child(3): Name | Project | Status | Type | ...
-            status_badge = cluster_row.locator("td:nth-child(3) .badge").first
-            status_text = status_badge.text_content() if status_badge.count() > 0 else "UNKNOWN"
+        if cluster_name in badges:
+            status_text = badges[cluster_name] or "UNKNOWN"
             log(f"   {cluster_type.upper()} cluster '{cluster_name}' - status: {status_text}")
 
             # Status should be IDLE or one of the valid operational states
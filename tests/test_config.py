@@ -5,19 +5,28 @@ Tests for configuration management.
 import pytest
 import os
 from pathlib import Path
-from atlasui.config import Settings, reload_settings
+from atlasui.config import Settings, get_settings, reload_settings
 
 
-def test_settings_defaults():
-    """Test default settings."""
-    settings = Settings(
+@pytest.fixture(scope="module")
+def default_settings():
+    """Settings with test credentials, validated once for the module."""
+    return get_settings(
         atlas_public_key="test_public",
         atlas_private_key="test_private"
     )
+
+
+def test_settings_defaults(default_settings):
+    """Test default settings."""
+    settings = default_settings
     assert settings.atlas_base_url == "https://cloud.mongodb.com"
     assert settings.atlas_api_version == "v2"
     assert settings.app_name == "AtlasUI"
     assert settings.port == 8000
+    assert settings.http_max_connections == 100
+    assert settings.http_max_keepalive == 20
+    assert settings.http2 is True
 
 
 def test_atlas_api_base_url():
@@ -31,6 +40,29 @@ def test_atlas_api_base_url():
     assert settings.atlas_api_base_url == "https://custom.mongodb.com/api/atlas/v3"
 
 
+@pytest.fixture
+def empty_settings_cache():
+    """Empty the get_settings cache around a test; the global settings are untouched."""
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
+def test_get_settings_is_cached(empty_settings_cache):
+    """Test get_settings reuses instances until its cache is cleared."""
+    first = get_settings(atlas_public_key="test_public", atlas_private_key="test_private")
+    same = get_settings(atlas_public_key="test_public", atlas_private_key="test_private")
+    assert same is first
+
+    other = get_settings(atlas_public_key="other_public", atlas_private_key="test_private")
+    assert other is not first
+    assert other.atlas_public_key == "other_public"
+
+    get_settings.cache_clear()
+    fresh = get_settings(atlas_public_key="test_public", atlas_private_key="test_private")
+    assert fresh is not first
+
+
 def test_reload_settings(tmp_path, monkeypatch):
     """Test settings reload functionality."""
     # Create a temporary .env file
@@ -0,0 +1,87 @@
+"""
+Tests for the retry and polling helpers in tests/http_retry.py.
+
+These run offline: HTTP calls are patched and poll_cluster_state runs on a
+fake clock, so no server, browser or Atlas credentials are needed.
+"""
+
+import itertools
+from unittest.mock import Mock, patch
+
+import httpx
+import pytest
+
+from tests.http_retry import next_delay, poll_cluster_state, retry_after_seconds
+
+
+def _cluster_response(state: str, paused: bool) -> Mock:
+    """Build a fake 200 response from the cluster API."""
+    response = Mock(status_code=200, headers={})
+    response.json.return_value = {"stateName": state, "paused": paused}
+    return response
+
+
+def test_next_delay_doubles_and_caps():
+    """Test poll delays double from the base and stop at the cap."""
+    assert [next_delay(attempt) for attempt in range(6)] == [2.0, 4.0, 8.0, 16.0, 30.0, 30.0]
+    assert next_delay(3, base=1.0, cap=5.0) == 5.0
+
+
+@pytest.mark.parametrize("headers, expected", [
+    ({"Retry-After": "7"}, 7.0),
+    ({"Retry-After": "1.5"}, 1.5),
+    ({"Retry-After": "Wed, 21 Oct 2026 07:28:00 GMT"}, None),
+    ({}, None),
+])
+def test_retry_after_seconds(headers, expected):
+    """Test only numeric Retry-After values are honoured."""
+    assert retry_after_seconds(httpx.Response(503, headers=headers)) == expected
+
+
+def test_poll_cluster_state_times_out_without_waiting():
+    """A cluster stuck in CREATING times out on a fake clock with no real sleeping."""
+    delays = []
+    stuck = _cluster_response("CREATING", False)
+    with patch.object(httpx, "get", return_value=stuck), pytest.raises(TimeoutError):
+        poll_cluster_state(
+            "project", "cluster", expected_paused=False, timeout=600,
+            time_source=itertools.count(0, 10).__next__,
+            sleep=delays.append,
+        )
+    assert delays
+    assert max(delays) <= 30
+
+
+def test_poll_cluster_state_returns_once_settled():
+    """The poller returns the cluster data once it settles with the expected paused flag."""
+    responses = [
+        _cluster_response("UPDATING", True),
+        _cluster_response("IDLE", True),
+    ]
+    delays = []
+    with patch.object(httpx, "get", side_effect=responses):
+        data = poll_cluster_state(
+            "project", "cluster", expected_paused=True,
+            time_source=itertools.count(0, 1).__next__,
+            sleep=delays.append,
+        )
+    assert data == {"stateName": "IDLE", "paused": True}
+    assert delays == [2.0]
+
+
+def test_poll_cluster_state_failed_poll_keeps_backoff():
+    """A 5xx poll retries after the base delay and honours its Retry-After hint."""
+    error = Mock(status_code=503, headers={"Retry-After": "5"})
+    responses = [
+        _cluster_response("UPDATING", True),
+        error,
+        _cluster_response("IDLE", True),
+    ]
+    delays = []
+    with patch.object(httpx, "get", side_effect=responses):
+        poll_cluster_state(
+            "project", "cluster", expected_paused=True,
+            time_source=itertools.count(0, 1).__next__,
+            sleep=delays.append,
+        )
+    assert delays == [2.0, 5.0]
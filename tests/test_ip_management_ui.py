@@ -11,11 +11,12 @@ This test file tests the IP management modal on the Projects page:
 Usage:
     uv run pytest tests/test_ip_management_ui.py -v -s
 """
+import functools
 import pytest
 import sys
 import time
 import httpx
-from playwright.sync_api import Page
+from playwright.sync_api import Page, TimeoutError as PlaywrightTimeoutError
 
 
 def log(msg: str) -> None:
@@ -32,8 +33,9 @@ TEST_CIDR = "10.99.99.0/24"
 TEST_COMMENT = "Playwright test entry"
 
 
+@functools.lru_cache(maxsize=None)
 def get_first_project_id() -> str:
-    """Get the first project ID from the API."""
+    """Get the first project ID from the API (looked up once per session)."""
     response = httpx.get(f"{BASE_URL}/api/projects/", timeout=30.0, follow_redirects=True)
     response.raise_for_status()
     data = response.json()
@@ -43,6 +45,17 @@ def get_first_project_id() -> str:
     return projects[0]["id"]
 
 
+def wait_for_projects_table(page: Page) -> None:
+    """Wait until the projects table has rendered its Manage IP buttons."""
+    page.wait_for_selector("#projectsContainer table tbody tr", timeout=30000)
+    page.locator('button[onclick*="openIPManagement"]').first.wait_for(state="visible", timeout=10000)
+
+
+def wait_for_ip_list(page: Page) -> None:
+    """Wait until the IP management modal has finished loading its list."""
+    page.locator("#ipListLoading").wait_for(state="hidden", timeout=10000)
+
+
 def cleanup_test_ip(project_id: str, ip_entry: str) -> None:
     """Remove a test IP entry if it exists (cleanup)."""
     try:
@@ -74,8 +87,7 @@ def test_open_ip_management_modal(page: Page, atlasui_server):
 
     # Wait for projects to load
     log("2. Waiting for projects table to load...")
-    page.wait_for_selector("#projectsContainer table tbody tr", timeout=30000)
-    time.sleep(1)  # Allow JavaScript to bind events
+    wait_for_projects_table(page)
 
     # Find and click the Manage IP button
     log("3. Finding Manage IP button...")
@@ -116,7 +128,7 @@ def test_open_ip_management_modal(page: Page, atlasui_server):
     log("7. Closing modal...")
     close_btn = page.locator("#ipManagementModal .btn-close")
     close_btn.click()
-    time.sleep(0.5)
+    page.locator("#ipManagementModal").wait_for(state="hidden", timeout=10000)
 
     log("\n" + "=" * 80)
     log("TEST PASSED: IP Management Modal opens correctly")
@@ -137,8 +149,7 @@ def test_ip_list_loads(page: Page, atlasui_server):
     log("\n1. Navigating to projects page...")
     page.goto(f"{BASE_URL}/projects")
     page.wait_for_load_state("domcontentloaded")
-    page.wait_for_selector("#projectsContainer table tbody tr", timeout=30000)
-    time.sleep(1)
+    wait_for_projects_table(page)
 
     # Open IP management modal
     log("2. Opening IP management modal...")
@@ -148,7 +159,7 @@ def test_ip_list_loads(page: Page, atlasui_server):
 
     # Wait for IP list to load (either table or empty message)
     log("3. Waiting for IP list to load...")
-    time.sleep(2)  # Allow API call to complete
+    wait_for_ip_list(page)
 
     # Check if we have IP entries or an empty message
     # The content is inside #ipListContent, table is #ipListTable
@@ -181,7 +192,7 @@ def test_ip_list_loads(page: Page, atlasui_server):
         loading = page.locator("#ipListLoading:not(.d-none)")
         if loading.count() > 0:
             log("   Still loading - waiting more...")
-            time.sleep(2)
+            wait_for_ip_list(page)
         else:
             log("   ✓ IP list loaded (state unclear)")
 
@@ -215,15 +226,14 @@ def test_add_ip_address(page: Page, atlasui_server):
     log("\n1. Navigating to projects page...")
     page.goto(f"{BASE_URL}/projects")
     page.wait_for_load_state("domcontentloaded")
-    page.wait_for_selector("#projectsContainer table tbody tr", timeout=30000)
-    time.sleep(1)
+    wait_for_projects_table(page)
 
     # Open IP management modal
     log("2. Opening IP management modal...")
     manage_ip_btn = page.locator('button[onclick*="openIPManagement"]').first
     manage_ip_btn.click()
     page.locator("#ipManagementModal").wait_for(state="visible", timeout=5000)
-    time.sleep(1)
+    wait_for_ip_list(page)
 
     # Fill in IP address
     log(f"3. Entering IP address: {TEST_IP}")
@@ -238,15 +248,19 @@ def test_add_ip_address(page: Page, atlasui_server):
     # Click Add button
     log("5. Clicking Add button...")
     add_btn = page.locator("#addIPBtn")
-    add_btn.click()
+    with page.expect_response(
+        lambda r: r.url.endswith("/access-list") and r.request.method == "POST",
+        timeout=30000
+    ):
+        add_btn.click()
 
-    # Wait for success (button should briefly show spinner then return to Add)
+    # Wait for success (the list reloads once the add completes)
     log("6. Waiting for add operation to complete...")
-    time.sleep(3)
+    wait_for_ip_list(page)
 
     # Verify the IP was added - check if it appears in the list
     log("7. Verifying IP was added to list...")
-    ip_entry = page.locator(f'#ipListBody td:has-text("{TEST_IP}")')
+    ip_entry = page.locator(f'#ipListBody tr[data-ip-address="{TEST_IP}"]')
 
     # The IP should appear in the list after successful add
     try:
@@ -309,15 +323,29 @@ def test_delete_ip_address(page: Page, atlasui_server):
     except Exception as e:
         log(f"   Warning: Could not add test IP: {e}")
 
-    # Give Atlas API time to propagate
-    time.sleep(2)
+    # Wait (up to 10s) for the entry to show up in Atlas before opening the modal
+    deadline = time.time() + 10
+    while time.time() < deadline:
+        resp = httpx.get(
+            f"{BASE_URL}/api/projects/{project_id}/access-list",
+            timeout=30.0,
+            follow_redirects=True
+        )
+        # Keep polling through server errors; only a 200 body can be read
+        if resp.status_code != 200:
+            log(f"   Access list poll returned status {resp.status_code}, retrying")
+        elif any(e.get("ipAddress") == TEST_IP for e in resp.json().get("results", [])):
+            break
+        time.sleep(0.5)
+    else:
+        log(f"   Warning: {TEST_IP} not in the API access list after 10s; "
+            "later steps may not find it")
 
     # Navigate to projects page
     log("2. Navigating to projects page...")
     page.goto(f"{BASE_URL}/projects")
     page.wait_for_load_state("domcontentloaded")
-    page.wait_for_selector("#projectsContainer table tbody tr", timeout=30000)
-    time.sleep(1)
+    wait_for_projects_table(page)
 
     # Open IP management modal
     log("3. Opening IP management modal...")
@@ -325,13 +353,12 @@ def test_delete_ip_address(page: Page, atlasui_server):
     manage_ip_btn.click()
     page.locator("#ipManagementModal").wait_for(state="visible", timeout=5000)
 
-    # Wait longer for list to fully load
     log("   Waiting for IP list to load...")
-    time.sleep(4)
+    wait_for_ip_list(page)
 
     # Find the test IP in the list - try multiple selectors
     log(f"4. Looking for test IP: {TEST_IP}")
-    ip_row = page.locator(f'#ipListBody tr:has(td:has-text("{TEST_IP}"))')
+    ip_row = page.locator(f'#ipListBody tr[data-ip-address="{TEST_IP}"]')
 
     # If not found, check if the IP appears anywhere in the table body
     if ip_row.count() == 0:
@@ -350,6 +377,7 @@ def test_delete_ip_address(page: Page, atlasui_server):
             timeout=30.0,
             follow_redirects=True
         )
+        resp.raise_for_status()
         entries = resp.json().get("results", [])
         found = any(e.get("ipAddress") == TEST_IP for e in entries)
         if found:
@@ -384,20 +412,22 @@ def test_delete_ip_address(page: Page, atlasui_server):
         delete_btn = ip_row.locator('button.btn-danger')
 
     assert delete_btn.count() > 0, "Delete button not found"
-    delete_btn.click()
 
-    # Handle confirmation dialog if present
+    # Accept the browser confirm dialog (Playwright dismisses dialogs by default)
     log("6. Confirming deletion...")
-    # Check for browser confirm dialog (page.on("dialog") or automatic accept)
-    time.sleep(0.5)
+    page.once("dialog", lambda dialog: dialog.accept())
+    delete_btn.click()
 
-    # Wait for deletion to complete
+    # Wait for the row to disappear once the list reloads
     log("7. Waiting for deletion to complete...")
-    time.sleep(2)
+    ip_row_after = page.locator(f'#ipListBody tr[data-ip-address="{TEST_IP}"]')
+    try:
+        ip_row_after.wait_for(state="detached", timeout=10000)
+    except PlaywrightTimeoutError:
+        log("   Row still present after 10s; checking the API below")
 
     # Verify the IP was removed from the list
     log("8. Verifying IP was removed...")
-    ip_row_after = page.locator(f'#ipListBody tr:has(td:has-text("{TEST_IP}"))')
 
     # Check if IP is no longer in the list
     if ip_row_after.count() == 0:
@@ -444,15 +474,14 @@ def test_add_ip_validation(page: Page, atlasui_server):
     log("\n1. Navigating to projects page...")
     page.goto(f"{BASE_URL}/projects")
     page.wait_for_load_state("domcontentloaded")
-    page.wait_for_selector("#projectsContainer table tbody tr", timeout=30000)
-    time.sleep(1)
+    wait_for_projects_table(page)
 
     # Open IP management modal
     log("2. Opening IP management modal...")
     manage_ip_btn = page.locator('button[onclick*="openIPManagement"]').first
     manage_ip_btn.click()
     page.locator("#ipManagementModal").wait_for(state="visible", timeout=5000)
-    time.sleep(1)
+    wait_for_ip_list(page)
 
     # Test 1: Empty IP address
     log("3. Testing empty IP address...")
@@ -508,8 +537,7 @@ def test_ip_management_modal_project_name_display(page: Page, atlasui_server):
     log("\n1. Navigating to projects page...")
     page.goto(f"{BASE_URL}/projects")
     page.wait_for_load_state("domcontentloaded")
-    page.wait_for_selector("#projectsContainer table tbody tr", timeout=30000)
-    time.sleep(1)
+    wait_for_projects_table(page)
 
     # Get the first project name from the table
     log("2. Getting project name from table...")